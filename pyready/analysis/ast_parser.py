@@ -1,21 +1,179 @@
 """AST-based Python code parser"""
 
 import ast
+import hashlib
+import os
+import pickle
+import sys
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
 
+# Filenames that conventionally mark an entry point
+_ENTRY_POINT_NAMES = frozenset({"main.py", "app.py", "run.py", "__main__.py"})
+
+
+class _Collector:
+    """
+    Single-pass AST walker that gathers imports, top-level functions/classes
+    and the `if __name__ == "__main__"` guard in one traversal.
+
+    Uses an explicit stack and a type-keyed handler dict instead of
+    ast.NodeVisitor: `type(node)` dict lookup is O(1) with no isinstance MRO
+    walk, and extending the stack avoids the generator frames `ast.walk`
+    allocates per node.
+    """
+
+    __slots__ = ("imports", "functions", "classes", "has_main_block")
+
+    def __init__(self):
+        self.imports = set()
+        self.functions = []
+        self.classes = []
+        self.has_main_block = False
+
+    def collect(
+        self,
+        tree: ast.Module,
+        # Default arguments resolve at def-time, making these LOAD_FAST
+        # locals inside the hot loops instead of repeated module lookups
+        _FunctionDef=ast.FunctionDef,
+        _AsyncFunctionDef=ast.AsyncFunctionDef,
+        _ClassDef=ast.ClassDef,
+        _If=ast.If,
+        _Try=ast.Try,
+        _isinstance=isinstance,
+        _list=list,
+        _type=type,
+        _getattr=getattr,
+    ) -> None:
+        """Walk the tree once, dispatching on exact node type"""
+        # Top-level definitions and the main guard come straight off the
+        # module body: `if __name__ == "__main__"` is by convention a
+        # top-level statement, so there is no need to inspect every nested
+        # `if` in the tree. Guards wrapped in a top-level try block are
+        # still caught.
+        for node in tree.body:
+            node_type = _type(node)
+            if node_type is _FunctionDef or node_type is _AsyncFunctionDef:
+                self.functions.append(node.name)
+            elif node_type is _ClassDef:
+                self.classes.append(node.name)
+            elif node_type is _If:
+                # Stop comparing once the first guard has matched
+                if not self.has_main_block and self._is_main_guard(node):
+                    self.has_main_block = True
+            elif node_type is _Try and not self.has_main_block:
+                for child in node.body:
+                    if _type(child) is _If and self._is_main_guard(child):
+                        self.has_main_block = True
+                        break
+
+        handlers = {
+            ast.Import: self._handle_import,
+            ast.ImportFrom: self._handle_import_from,
+        }
+
+        # Push children by reading _fields directly instead of going
+        # through iter_child_nodes/iter_fields, which cost two generator
+        # frames per node. Hot names are bound locally.
+        AST = ast.AST
+        get_handler = handlers.get
+        stack = [tree]
+        pop = stack.pop
+        append = stack.append
+        while stack:
+            node = pop()
+            handler = get_handler(_type(node))
+            if handler is not None:
+                handler(node)
+            for name in node._fields:
+                value = _getattr(node, name, None)
+                if _isinstance(value, AST):
+                    append(value)
+                elif _isinstance(value, _list):
+                    for item in value:
+                        if _isinstance(item, AST):
+                            append(item)
+
+    def _handle_import(self, node: ast.Import) -> None:
+        # Handle: import module
+        # Interned so the same module name recurring across hundreds of
+        # files shares one str object (pointer-compare set lookups)
+        for alias in node.names:
+            self.imports.add(sys.intern(alias.name))
+
+    def _handle_import_from(self, node: ast.ImportFrom) -> None:
+        # Handle: from module import ...
+        if node.module:  # module can be None for relative imports like "from . import x"
+            self.imports.add(sys.intern(node.module))
+
+    @staticmethod
+    def _is_main_guard(node: ast.If) -> bool:
+        """
+        Check if an `if` node is: if __name__ == "__main__"
+
+        Looks for:
+        - if __name__ == "__main__":
+        - if "__main__" == __name__:
+        """
+        if not isinstance(node.test, ast.Compare):
+            return False
+
+        compare = node.test
+
+        # Bind hot ast types to locals once; this check runs per `if` node
+        Name, Constant = ast.Name, ast.Constant
+
+        # Check left side is __name__
+        left_is_name = (
+            isinstance(compare.left, Name) and
+            compare.left.id == "__name__"
+        )
+
+        # Check right side is "__main__"
+        right_is_main = (
+            len(compare.comparators) > 0 and
+            isinstance(compare.comparators[0], Constant) and
+            compare.comparators[0].value == "__main__"
+        )
+
+        # Check operators (should be == or !=, but we only care about ==)
+        is_equal = any(isinstance(op, ast.Eq) for op in compare.ops)
+
+        if (left_is_name and right_is_main and is_equal):
+            return True
+
+        # Also check reverse: if "__main__" == __name__
+        left_is_main = (
+            isinstance(compare.left, Constant) and
+            compare.left.value == "__main__"
+        )
+        right_is_name = (
+            len(compare.comparators) > 0 and
+            isinstance(compare.comparators[0], Name) and
+            compare.comparators[0].id == "__name__"
+        )
+
+        return (left_is_main and right_is_name and is_equal)
+
+
 class ASTParser:
     """Parses Python files using AST to extract structure"""
-    
+
     @staticmethod
-    def parse_file(file_path: Path) -> Dict:
+    def parse_file(file_path: Path, cache_dir: Optional[Path] = None) -> Dict:
         """
         Parse a Python file and extract imports, functions, classes
-        
+
+        Results are optionally cached on disk keyed by a SHA256 of the file
+        content plus the running Python version, so unchanged files skip
+        `ast.parse` entirely on subsequent runs.
+
         Args:
             file_path: Path to Python file
-            
+            cache_dir: Optional directory for the on-disk result cache
+
         Returns:
             Dictionary with extracted information:
             {
@@ -26,6 +184,31 @@ class ASTParser:
                 "error": Optional[str]
             }
         """
+        try:
+            # Read file content
+            with open(file_path, "rb") as f:
+                content_bytes = f.read()
+        except Exception as e:
+            return {
+                "imports": [],
+                "functions": [],
+                "classes": [],
+                "has_main_block": False,
+                "error": f"Unexpected error: {str(e)}"
+            }
+
+        return ASTParser.parse_bytes(file_path, content_bytes, cache_dir=cache_dir)
+
+    @staticmethod
+    def parse_bytes(
+        file_path: Path, content_bytes: bytes, cache_dir: Optional[Path] = None
+    ) -> Dict:
+        """
+        Parse already-read source bytes; see parse_file for the result shape
+
+        Split out from parse_file so callers that batch or prefetch file
+        reads can hand the bytes over without a second read.
+        """
         result = {
             "imports": [],
             "functions": [],
@@ -33,126 +216,78 @@ class ASTParser:
             "has_main_block": False,
             "error": None
         }
-        
+
+        cache_file = None
+
         try:
-            # Read file content
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            # Parse AST
-            tree = ast.parse(content, filename=str(file_path))
-            
-            # Extract information
-            result["imports"] = ASTParser._extract_imports(tree)
-            result["functions"] = ASTParser._extract_functions(tree)
-            result["classes"] = ASTParser._extract_classes(tree)
-            result["has_main_block"] = ASTParser._detect_main_block(tree)
-            
+            # Check the on-disk cache before parsing
+            if cache_dir is not None:
+                key = hashlib.sha256(content_bytes).hexdigest()
+                version = "%d.%d" % sys.version_info[:2]
+                cache_file = cache_dir / f"{key}-{version}.pkl"
+
+                cached = ASTParser._load_cached_result(cache_file)
+                if cached is not None:
+                    return cached
+
+            # Parse AST straight from bytes; ast.parse handles the coding
+            # cookie itself, so no separate full decode pass is needed
+            tree = ast.parse(content_bytes, filename=str(file_path))
+
+            # Extract everything in a single traversal
+            collector = _Collector()
+            collector.collect(tree)
+
+            # Sorted so dependency edges (and cached results) are reproducible
+            result["imports"] = sorted(collector.imports)
+            result["functions"] = collector.functions
+            result["classes"] = collector.classes
+            result["has_main_block"] = collector.has_main_block
+
+            if cache_file is not None:
+                ASTParser._store_cached_result(cache_file, result)
+
         except SyntaxError as e:
             result["error"] = f"SyntaxError: {str(e)}"
         except UnicodeDecodeError as e:
             result["error"] = f"UnicodeDecodeError: {str(e)}"
         except Exception as e:
             result["error"] = f"Unexpected error: {str(e)}"
-        
+
         return result
-    
-    @staticmethod
-    def _extract_imports(tree: ast.AST) -> List[str]:
-        """Extract all import statements from AST"""
-        imports = []
-        
-        for node in ast.walk(tree):
-            # Handle: import module
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            
-            # Handle: from module import ...
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:  # module can be None for relative imports like "from . import x"
-                    imports.append(node.module)
-        
-        return list(set(imports))  # Remove duplicates
-    
-    @staticmethod
-    def _extract_functions(tree: ast.AST) -> List[str]:
-        """Extract all function definitions from AST (top-level only)"""
-        functions = []
-        
-        for node in ast.iter_child_nodes(tree):
-            if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                functions.append(node.name)
-        
-        return functions
-    
+
     @staticmethod
-    def _extract_classes(tree: ast.AST) -> List[str]:
-        """Extract all class definitions from AST (top-level only)"""
-        classes = []
-        
-        for node in ast.iter_child_nodes(tree):
-            if isinstance(node, ast.ClassDef):
-                classes.append(node.name)
-        
-        return classes
-    
+    def _load_cached_result(cache_file: Path) -> Optional[Dict]:
+        """Load a cached parse result, ignoring missing or corrupt entries"""
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
     @staticmethod
-    def _detect_main_block(tree: ast.AST) -> bool:
-        """
-        Detect if file contains: if __name__ == "__main__"
-        
-        Looks for:
-        - if __name__ == "__main__":
-        - if "__main__" == __name__:
-        """
-        for node in ast.walk(tree):
-            if isinstance(node, ast.If):
-                # Check if condition is a comparison
-                if isinstance(node.test, ast.Compare):
-                    compare = node.test
-                    
-                    # Check left side is __name__
-                    left_is_name = (
-                        isinstance(compare.left, ast.Name) and 
-                        compare.left.id == "__name__"
-                    )
-                    
-                    # Check right side is "__main__"
-                    right_is_main = (
-                        len(compare.comparators) > 0 and
-                        isinstance(compare.comparators[0], ast.Constant) and
-                        compare.comparators[0].value == "__main__"
-                    )
-                    
-                    # Check operators (should be == or !=, but we only care about ==)
-                    is_equal = any(isinstance(op, ast.Eq) for op in compare.ops)
-                    
-                    if (left_is_name and right_is_main and is_equal):
-                        return True
-                    
-                    # Also check reverse: if "__main__" == __name__
-                    left_is_main = (
-                        isinstance(compare.left, ast.Constant) and 
-                        compare.left.value == "__main__"
-                    )
-                    right_is_name = (
-                        len(compare.comparators) > 0 and
-                        isinstance(compare.comparators[0], ast.Name) and
-                        compare.comparators[0].id == "__name__"
-                    )
-                    
-                    if (left_is_main and right_is_name and is_equal):
-                        return True
-        
-        return False
-    
+    def _store_cached_result(cache_file: Path, result: Dict) -> None:
+        """Write a parse result to the cache atomically (best-effort)"""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp_file, "wb") as f:
+                pickle.dump(result, f)
+            # Atomic rename so concurrent runs never see partial files
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
     @staticmethod
     def is_entry_point_file(file_path: Path) -> bool:
         """
         Check if filename suggests it's an entry point
-        
+
         Entry point files: main.py, app.py, run.py, __main__.py
         """
-        entry_point_names = {"main.py", "app.py", "run.py", "__main__.py"}
-        return file_path.name in entry_point_names
+        return file_path.name in _ENTRY_POINT_NAMES
+
+    @staticmethod
+    def is_entry_point_name(file_name: str) -> bool:
+        """String variant of is_entry_point_file for callers holding names"""
+        return file_name in _ENTRY_POINT_NAMES
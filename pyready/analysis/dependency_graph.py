@@ -1,24 +1,65 @@
 """Dependency graph builder for repository analysis"""
 
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from pyready.schemas.repo_schema import PythonFile, ModuleDependency, RepositoryGraph
 from pyready.ingestion.repo_scanner import RepoScanner
 from pyready.analysis.ast_parser import ASTParser
 
+# Below this many files, process-spawn overhead outweighs the parallel win
+_PARALLEL_THRESHOLD = 8
+
+# In-memory parse cache for repeated build() calls within one process
+# (watch mode / repeated invocations): unchanged files skip open, hash and
+# parse and cost only a stat. A plain dict rather than lru_cache so results
+# coming back from the prefetch and process-pool paths can be inserted.
+_mtime_cache: Dict[Tuple[str, int, int], Dict] = {}
+
+
+def _stat_key(path_str: str) -> Optional[Tuple[str, int, int]]:
+    """Cache key identifying a file version, or None if stat fails"""
+    try:
+        st = os.stat(path_str)
+    except OSError:
+        return None
+    return (path_str, st.st_mtime_ns, st.st_size)
+
+
+def _parse_one(path_str: str, cache_dir: Optional[Path] = None) -> Tuple[str, Dict]:
+    """Parse a single file; module-level so it is picklable for worker processes"""
+    return path_str, ASTParser.parse_file(Path(path_str), cache_dir=cache_dir)
+
+
+def _read_bytes(file_path: Path) -> Optional[bytes]:
+    """Read a file's bytes, deferring errors to the parse path"""
+    try:
+        return file_path.read_bytes()
+    except OSError:
+        return None
+
 
 class DependencyGraphBuilder:
     """Builds a dependency graph from repository analysis"""
-    
-    def __init__(self, repo_path: str):
+
+    def __init__(self, repo_path: str, cache_dir: Optional[Path] = None):
         """
         Initialize graph builder
-        
+
         Args:
             repo_path: Path to repository
+            cache_dir: Directory for the on-disk AST cache; defaults to
+                .pyready_cache/ast under the repository root
         """
         self.repo_path = repo_path
         self.scanner = RepoScanner(repo_path)
+
+        if cache_dir is None:
+            cache_dir = self.scanner.repo_path / ".pyready_cache" / "ast"
+        self.cache_dir = cache_dir
     
     def build(self) -> RepositoryGraph:
         """
@@ -36,24 +77,28 @@ class DependencyGraphBuilder:
         entry_points = []
         errors = []
         
-        # Analyze each file
-        for file_path in python_files:
+        # Analyze each file; the loop works on plain strings throughout so
+        # no per-file PurePath objects are allocated
+        repo_root = str(self.scanner.repo_path)
+        relpath = os.path.relpath
+        basename = os.path.basename
+
+        for path_str, parse_result in self._parse_files(python_files):
             try:
-                # Parse file
-                parse_result = ASTParser.parse_file(file_path)
-                
-                # Get relative path
-                relative_path = self.scanner.get_relative_path(file_path)
-                
+                # Get relative path (interned: reused as the source of
+                # every dependency edge this file produces)
+                relative_path = sys.intern(relpath(path_str, repo_root))
+
                 # Determine if entry point
                 is_entry = (
-                    parse_result["has_main_block"] or 
-                    ASTParser.is_entry_point_file(file_path)
+                    parse_result["has_main_block"] or
+                    ASTParser.is_entry_point_name(basename(path_str))
                 )
                 
-                # Create PythonFile object
-                python_file = PythonFile(
-                    path=str(file_path),
+                # Create PythonFile object; the fields come from our own
+                # parser, so skip pydantic validation via model_construct
+                python_file = PythonFile.model_construct(
+                    path=path_str,
                     relative_path=relative_path,
                     imports=parse_result["imports"],
                     functions=parse_result["functions"],
@@ -69,10 +114,12 @@ class DependencyGraphBuilder:
                     entry_points.append(relative_path)
                 
                 # Build dependency edges
+                # Re-intern here as well: results arriving from worker
+                # processes or the pickle cache carry fresh str objects
                 for imported_module in parse_result["imports"]:
-                    dependency = ModuleDependency(
+                    dependency = ModuleDependency.model_construct(
                         source=relative_path,
-                        target=imported_module,
+                        target=sys.intern(imported_module),
                         import_type="import"
                     )
                     dependencies.append(dependency)
@@ -83,7 +130,7 @@ class DependencyGraphBuilder:
                     
             except Exception as e:
                 # Catch any unexpected errors during file processing
-                relative_path = self.scanner.get_relative_path(file_path)
+                relative_path = relpath(path_str, repo_root)
                 error_msg = f"{relative_path}: Unexpected error: {str(e)}"
                 errors.append(error_msg)
         
@@ -98,3 +145,52 @@ class DependencyGraphBuilder:
         )
         
         return graph
+
+    def _parse_files(self, python_files: List[Path]):
+        """
+        Yield (path, parse_result) pairs for each file
+
+        Parsing is CPU-bound, so larger repos fan out across a process pool;
+        small repos stay serial to avoid process-spawn overhead.
+        """
+        # Serve unchanged files from the in-memory cache first
+        misses = []
+        for file_path in python_files:
+            path_str = str(file_path)
+            key = _stat_key(path_str)
+            cached = _mtime_cache.get(key) if key is not None else None
+            if cached is not None:
+                yield path_str, cached
+            else:
+                misses.append((path_str, key))
+
+        if not misses:
+            return
+
+        parse_one = partial(_parse_one, cache_dir=self.cache_dir)
+
+        if len(misses) < _PARALLEL_THRESHOLD:
+            # Overlap the blocking reads with a small thread pool, then
+            # parse the prefetched bytes in the main thread
+            miss_paths = [Path(path_str) for path_str, _ in misses]
+            with ThreadPoolExecutor(max_workers=len(misses)) as pool:
+                contents = pool.map(_read_bytes, miss_paths)
+            for (path_str, key), content in zip(misses, contents):
+                if content is None:
+                    _, result = parse_one(path_str)
+                else:
+                    result = ASTParser.parse_bytes(
+                        Path(path_str), content, cache_dir=self.cache_dir
+                    )
+                if key is not None:
+                    _mtime_cache[key] = result
+                yield path_str, result
+        else:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = executor.map(
+                    parse_one, [path_str for path_str, _ in misses], chunksize=16
+                )
+                for (path_str, key), (_, result) in zip(misses, results):
+                    if key is not None:
+                        _mtime_cache[key] = result
+                    yield path_str, result
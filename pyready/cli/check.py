@@ -3,33 +3,42 @@
 import sys
 from pathlib import Path
 from typing import List, Optional
-from rich.console import Console
-from rich.panel import Panel
 
 from pyready.project_detection import ProjectType
-from pyready.project_detection.capabilities import CapabilityDetector
-from pyready.schemas.capability_schema import CapabilityCheckResult
-from pyready.project_intent import classify_project_intent
-from pyready.recommendations import generate_recommendations
-from pyready.reporting import generate_report, export_json, export_markdown
-from pyready.env_checker import EnvironmentChecker
-from pyready.schemas.env_schema import CheckStatus, CheckResult
-
-# Import run detection (will fail gracefully if backend not available)
-try:
-    from pyready.run_detection.detector import RunCommandDetector
-    RUN_DETECTION_AVAILABLE = True
-except ImportError:
-    RUN_DETECTION_AVAILABLE = False
-
-# Import explanation generator
-try:
-    from pyready.explanation.generator import ExplanationGenerator
-    EXPLANATION_AVAILABLE = True
-except ImportError:
-    EXPLANATION_AVAILABLE = False
-
-console = Console()
+from pyready.schemas.env_schema import CheckStatus
+
+# Rich and the heavy analysis subtrees (capabilities, recommendations,
+# reporting, env checks, run detection, explanation) are imported lazily
+# at first use so `pyready --help` and error paths skip their cost.
+
+_console = None
+
+
+def _get_console():
+    """Create the shared Rich console on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def _get_run_command_detector():
+    """Import RunCommandDetector lazily; None if backend not available"""
+    try:
+        from pyready.run_detection.detector import RunCommandDetector
+    except ImportError:
+        return None
+    return RunCommandDetector
+
+
+def _get_explanation_generator():
+    """Import ExplanationGenerator lazily; None if backend not available"""
+    try:
+        from pyready.explanation.generator import ExplanationGenerator
+    except ImportError:
+        return None
+    return ExplanationGenerator
 
 
 def check_environment(
@@ -47,12 +56,18 @@ def check_environment(
         enable_explanations: Whether to include AI-assisted explanations (requires GROQ_API_KEY)
         output_path: Optional path to export report (infers format from extension)
     """
+    from pyready.project_detection.capabilities import CapabilityDetector
+    from pyready.project_intent import classify_project_intent
+    from pyready.recommendations import generate_recommendations
+    from pyready.env_checker import EnvironmentChecker
+
+    console = _get_console()
     console.print(f"🔍 Checking environment for: [cyan]{project_path}[/cyan]\n")
-    
+
     # Detect and display project capabilities
     capabilities = None
     intent = None
-    
+
     try:
         capability_detector = CapabilityDetector(project_path)
         capability_result = capability_detector.detect()
@@ -60,9 +75,9 @@ def check_environment(
         
         _display_capabilities(capability_result)
         
-        # Display project intent
-        intent, _ = classify_project_intent(capabilities, project_path)
-        _display_intent(capabilities, project_path)
+        # Display project intent (classified once, result passed through)
+        intent, reasoning = classify_project_intent(capabilities, project_path)
+        _display_intent(intent, reasoning)
     
     except Exception as e:
         console.print(f"[yellow]⚠ Could not detect capabilities:[/yellow] {str(e)}\n")
@@ -85,17 +100,18 @@ def check_environment(
     if capabilities and intent and report:
         try:
             recommendations = generate_recommendations(capabilities, intent, report.checks)
-            _display_recommendations(capabilities, intent, report.checks)
+            _display_recommendations(recommendations, intent)
         except Exception as e:
             console.print(f"[yellow]⚠ Could not generate recommendations:[/yellow] {str(e)}\n")
     
     # Run command detection (for export only - don't display yet)
     run_cmd = None
     run_cmd_evidence = None
-    
-    if RUN_DETECTION_AVAILABLE:
+
+    run_detector_cls = _get_run_command_detector()
+    if run_detector_cls is not None:
         try:
-            detector = RunCommandDetector(project_path, project_type=project_type.value)
+            detector = run_detector_cls(project_path, project_type=project_type.value)
             result = detector.detect()
             
             if result.has_command():
@@ -127,12 +143,13 @@ def check_environment(
             console.print(f"\n[red]Error exporting report:[/red] {str(e)}")
 
 
-def _display_capabilities(result: CapabilityCheckResult) -> None:
+def _display_capabilities(result) -> None:
     """Display project capabilities"""
-    console.print("📦 [bold]Project capabilities:[/bold]")
-    
+    # Accumulate markup lines and emit a single console.print at the end
+    lines = ["📦 [bold]Project capabilities:[/bold]"]
+
     caps = result.capabilities
-    
+
     # Define display order and labels
     capability_display = [
         ('has_python_files', 'Python files detected'),
@@ -141,10 +158,10 @@ def _display_capabilities(result: CapabilityCheckResult) -> None:
         ('has_reproducible_environment', 'Reproducible environment (lock file)'),
         ('has_detectable_entrypoint', 'Entry point detectable'),
     ]
-    
+
     for field_name, label in capability_display:
         has_capability = getattr(caps, field_name)
-        
+
         if has_capability:
             symbol = "✔"
             color = "green"
@@ -153,29 +170,28 @@ def _display_capabilities(result: CapabilityCheckResult) -> None:
             symbol = "○"
             color = "dim"
             status = f"{label}: not detected"
-        
-        console.print(f"  {symbol} [{color}]{status}[/{color}]")
-        
+
+        lines.append(f"  {symbol} [{color}]{status}[/{color}]")
+
         # Show evidence if available and capability is true
         if has_capability and field_name in caps.evidence:
             evidence_items = caps.evidence[field_name]
-            
+
             # Show first 3 evidence items
             for item in evidence_items[:3]:
-                console.print(f"    [dim]• {item}[/dim]")
-            
+                lines.append(f"    [dim]• {item}[/dim]")
+
             # Show count if more than 3
             if len(evidence_items) > 3:
                 remaining = len(evidence_items) - 3
-                console.print(f"    [dim]• ... and {remaining} more[/dim]")
-    
-    console.print()
+                lines.append(f"    [dim]• ... and {remaining} more[/dim]")
 
+    lines.append("")
+    _get_console().print("\n".join(lines))
 
-def _display_intent(capabilities, project_path: Path) -> None:
-    """Display project intent classification"""
-    intent, reasoning = classify_project_intent(capabilities, project_path)
-    
+
+def _display_intent(intent, reasoning: str) -> None:
+    """Display an already-classified project intent"""
     # Icon mapping
     icons = {
         'script': '📄',
@@ -186,6 +202,7 @@ def _display_intent(capabilities, project_path: Path) -> None:
     }
     
     icon = icons.get(intent.value, '❓')
+    console = _get_console()
     console.print(f"{icon} [bold]Project intent:[/bold] {intent}")
     console.print(f"  [dim]{reasoning}[/dim]")
     console.print()
@@ -193,69 +210,69 @@ def _display_intent(capabilities, project_path: Path) -> None:
 
 def _display_check_results(report) -> None:
     """Display environment check results"""
+    lines = []
+
     for check in report.checks:
         status_symbol = _get_status_symbol(check.status)
         status_color = _get_status_color(check.status)
-        
-        console.print(f"{status_symbol} [{status_color}]{check.category}:[/{status_color}] {check.message}")
-        
+
+        lines.append(f"{status_symbol} [{status_color}]{check.category}:[/{status_color}] {check.message}")
+
         # Display details (improved formatting)
         if check.details:
             if isinstance(check.details, dict):
                 # Extract and display info from dict
                 info = check.details.get("info", "")
                 if info:
-                    console.print(f"  [dim]{info}[/dim]")
+                    lines.append(f"  [dim]{info}[/dim]")
             else:
-                console.print(f"  [dim]{check.details}[/dim]")
-        
+                lines.append(f"  [dim]{check.details}[/dim]")
+
         if check.fix_command:
-            console.print(f"  → [yellow]Suggested fix:[/yellow] {check.fix_command}\n")
-    
+            lines.append(f"  → [yellow]Suggested fix:[/yellow] {check.fix_command}\n")
+
     # Display summary
-    console.print("─" * 80)
-    console.print("\n📊 [bold]Summary:[/bold]")
-    console.print(f"  Total checks: {report.summary['total']}")
-    console.print(f"  ✔ [green]Passed:[/green] {report.summary['passed']}")
-    console.print(f"  ✖ [red]Failed:[/red] {report.summary['failed']}")
-    console.print(f"  ⚠ [yellow]Warnings:[/yellow] {report.summary['warnings']}")
-    console.print()
+    lines.append("─" * 80)
+    lines.append("\n📊 [bold]Summary:[/bold]")
+    lines.append(f"  Total checks: {report.summary['total']}")
+    lines.append(f"  ✔ [green]Passed:[/green] {report.summary['passed']}")
+    lines.append(f"  ✖ [red]Failed:[/red] {report.summary['failed']}")
+    lines.append(f"  ⚠ [yellow]Warnings:[/yellow] {report.summary['warnings']}")
+    lines.append("")
 
+    _get_console().print("\n".join(lines))
+
+
+def _display_recommendations(recommendations, intent) -> None:
+    """Display already-generated recommendations for project improvement"""
+    lines = ["─" * 80, "\n💡 [bold]Recommendations:[/bold]\n"]
 
-def _display_recommendations(
-    capabilities,
-    intent,
-    check_results: List[CheckResult]
-) -> None:
-    """Display recommendations for project improvement"""
-    console.print("─" * 80)
-    console.print("\n💡 [bold]Recommendations:[/bold]\n")
-    
-    recommendations = generate_recommendations(capabilities, intent, check_results)
-    
     if not recommendations:
         # Special message for SCRIPT intent
         if intent.value == 'script':
-            console.print("  [dim]No recommendations — scripts don't require complex setup.[/dim]")
+            lines.append("  [dim]No recommendations — scripts don't require complex setup.[/dim]")
         else:
-            console.print("  [dim]No recommendations — project structure looks healthy.[/dim]")
-        console.print()
+            lines.append("  [dim]No recommendations — project structure looks healthy.[/dim]")
+        lines.append("")
+        _get_console().print("\n".join(lines))
         return
-    
+
     for rec in recommendations:
-        console.print(f"  [bold cyan]• {rec.title}[/bold cyan]")
-        console.print(f"    {rec.description}")
-        
+        lines.append(f"  [bold cyan]• {rec.title}[/bold cyan]")
+        lines.append(f"    {rec.description}")
+
         # Display evidence
-        console.print(f"    [dim]Evidence:[/dim]")
+        lines.append(f"    [dim]Evidence:[/dim]")
         for evidence_item in rec.evidence:
-            console.print(f"      [dim]- {evidence_item}[/dim]")
-        
+            lines.append(f"      [dim]- {evidence_item}[/dim]")
+
         # Display example command if present
         if rec.example_command:
-            console.print(f"    [yellow]Example:[/yellow] {rec.example_command}")
-        
-        console.print()
+            lines.append(f"    [yellow]Example:[/yellow] {rec.example_command}")
+
+        lines.append("")
+
+    _get_console().print("\n".join(lines))
 
 
 def _export_report(
@@ -270,6 +287,10 @@ def _export_report(
     output_path: Path
 ) -> None:
     """Export report to specified format"""
+    from pyready.reporting import generate_report, export_json, export_markdown
+
+    console = _get_console()
+
     # Generate report
     report_obj = generate_report(
         project_path=str(project_path),
@@ -298,32 +319,29 @@ def _export_report(
         console.print("  Supported formats: .json, .md")
 
 
+_STATUS_SYMBOL = {
+    CheckStatus.PASS: "✔",
+    CheckStatus.FAIL: "✖",
+    CheckStatus.WARN: "⚠",
+    CheckStatus.INFO: "ℹ",
+}
+
+_STATUS_COLOR = {
+    CheckStatus.PASS: "green",
+    CheckStatus.FAIL: "red",
+    CheckStatus.WARN: "yellow",
+    CheckStatus.INFO: "cyan",
+}
+
+
 def _get_status_symbol(status: CheckStatus) -> str:
     """Get symbol for check status"""
-    if status == CheckStatus.PASS:
-        return "✔"
-    elif status == CheckStatus.FAIL:
-        return "✖"
-    elif status == CheckStatus.WARN:
-        return "⚠"
-    elif status == CheckStatus.INFO:
-        return "ℹ"
-    else:
-        return "ℹ"
+    return _STATUS_SYMBOL.get(status, "ℹ")
 
 
 def _get_status_color(status: CheckStatus) -> str:
     """Get color for check status"""
-    if status == CheckStatus.PASS:
-        return "green"
-    elif status == CheckStatus.FAIL:
-        return "red"
-    elif status == CheckStatus.WARN:
-        return "yellow"
-    elif status == CheckStatus.INFO:
-        return "cyan"
-    else:
-        return "cyan"
+    return _STATUS_COLOR.get(status, "cyan")
 
 
 def detect_run_command(project_path: Path, project_type: ProjectType, enable_explanations: bool = False) -> None:
@@ -335,17 +353,20 @@ def detect_run_command(project_path: Path, project_type: ProjectType, enable_exp
         project_type: Detected project type
         enable_explanations: Whether to generate AI explanations (requires GROQ_API_KEY)
     """
-    if not RUN_DETECTION_AVAILABLE:
+    console = _get_console()
+
+    run_detector_cls = _get_run_command_detector()
+    if run_detector_cls is None:
         console.print("─" * 80)
         console.print("\n⚠ [yellow]Run command detection unavailable[/yellow]")
         console.print("  [dim]Backend module not found[/dim]\n")
         return
-    
+
     console.print("─" * 80)
     console.print("\n▶ [bold]Recommended run command:[/bold]\n")
-    
+
     try:
-        detector = RunCommandDetector(project_path, project_type=project_type.value)
+        detector = run_detector_cls(project_path, project_type=project_type.value)
         result = detector.detect()
         
         if result.has_command():
@@ -414,12 +435,15 @@ def generate_explanation(result, project_path: Path) -> None:
         result: RunCommandResult from detection
         project_path: Path to the project directory
     """
-    if not EXPLANATION_AVAILABLE:
+    console = _get_console()
+
+    explanation_generator_cls = _get_explanation_generator()
+    if explanation_generator_cls is None:
         console.print("\n  [dim]ℹ️  Natural language explanations unavailable (backend module not found)[/dim]")
         return
-    
+
     try:
-        generator = ExplanationGenerator()
+        generator = explanation_generator_cls()
         
         # PHASE 14.5: Check if Groq is available before attempting
         if not generator.is_available():
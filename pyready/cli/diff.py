@@ -1,15 +1,28 @@
 """Diff command implementation"""
 
 import json
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from rich.console import Console
+from rich.markup import escape
+
+from pyready import __version__
+
+# orjson parses report-sized JSON several times faster than stdlib json;
+# fall back silently so the CLI stays dependency-light
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from pyready.schemas.report_schema import OnboardAIReport
 from pyready.reporting import diff_reports, export_diff_json, export_diff_markdown
 from pyready.policy import (
-    load_policy, 
-    evaluate_policy, 
-    explain_policy,
+    load_policy,
+    evaluate_policy,
+    evaluate_and_explain,
     export_explanation_json,
     export_explanation_markdown
 )
@@ -40,17 +53,13 @@ def diff_command(
     
     # Load reports
     try:
-        with open(old_path, 'r', encoding='utf-8') as f:
-            old_data = json.load(f)
-        old_report = OnboardAIReport(**old_data)
+        old_report = _load_report(old_path)
     except Exception as e:
         console.print(f"[red]Error loading old report:[/red] {e}")
         return 2
-    
+
     try:
-        with open(new_path, 'r', encoding='utf-8') as f:
-            new_data = json.load(f)
-        new_report = OnboardAIReport(**new_data)
+        new_report = _load_report(new_path)
     except Exception as e:
         console.print(f"[red]Error loading new report:[/red] {e}")
         return 2
@@ -82,14 +91,19 @@ def diff_command(
     if policy_path:
         try:
             policy = load_policy(policy_path)
-            result = evaluate_policy(diff, policy)
-            
+
+            # The fused path derives the explanation from the same rule
+            # pass that produced the result, so asking for it is free
+            if explain_policy_flag:
+                result, explanation = evaluate_and_explain(diff, policy)
+            else:
+                result = evaluate_policy(diff, policy)
+                explanation = None
+
             console.print()  # Blank line
             _display_policy_result(result)
-            
-            # Generate explanation if requested
-            if explain_policy_flag:
-                explanation = explain_policy(diff, policy, result)
+
+            if explanation is not None:
                 console.print()  # Blank line
                 _display_policy_explanation(explanation)
             
@@ -111,27 +125,92 @@ def diff_command(
     return exit_code
 
 
+def _load_json(path: Path) -> dict:
+    """Load a JSON report file, using orjson when available"""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _construct_report(data: dict) -> OnboardAIReport:
+    """Build a report from trusted data, bypassing pydantic validation"""
+    from pyready.schemas.capability_schema import ProjectCapabilities
+    from pyready.schemas.env_schema import CheckResult, CheckStatus
+    from pyready.recommendations.models import Recommendation
+
+    fields = dict(data)
+    if isinstance(fields.get("generated_at"), str):
+        fields["generated_at"] = datetime.fromisoformat(fields["generated_at"])
+    fields["capabilities"] = ProjectCapabilities.model_construct(**fields["capabilities"])
+    # Coerce status by hand: model_construct skips validation, and a raw
+    # "PASS" string would not compare equal to the CheckStatus member the
+    # validated path produces, making diffs see phantom status changes
+    fields["checks"] = [
+        CheckResult.model_construct(**{**c, "status": CheckStatus(c["status"])})
+        for c in fields["checks"]
+    ]
+    fields["recommendations"] = [
+        Recommendation.model_construct(**r) for r in fields["recommendations"]
+    ]
+    return OnboardAIReport.model_construct(**fields)
+
+
+@lru_cache(maxsize=32)
+def _load_report_cached(path_str: str, mtime_ns: int, size: int) -> OnboardAIReport:
+    """Parse (and, for external reports, validate) a memoized report"""
+    data = _load_json(Path(path_str))
+
+    # Reports written by this same pyready version are machine-generated
+    # and already schema-shaped; skip pydantic validation for them
+    if data.get("tool_version") == __version__:
+        try:
+            return _construct_report(data)
+        except Exception:
+            pass
+
+    return OnboardAIReport(**data)
+
+
+def _load_report(path: Path) -> OnboardAIReport:
+    """
+    Load a report with memoization keyed on (path, mtime, size)
+
+    Repeated diffs against the same baseline (the common CI loop) skip the
+    JSON parse and pydantic validation entirely within a process. Cached
+    models are shared, so callers must treat them as read-only — diffing
+    and policy evaluation only read them.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return OnboardAIReport(**_load_json(path))
+    return _load_report_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
 def _display_diff_summary(diff) -> None:
     """Display human-readable diff summary"""
-    
-    console.print(f"\n📊 [bold]Diff Summary[/bold]")
-    console.print(f"From: [cyan]{diff.from_report}[/cyan]")
-    console.print(f"To:   [cyan]{diff.to_report}[/cyan]")
-    console.print()
-    
+    # Buffer all markup lines and flush with a single console.print; large
+    # diffs would otherwise pay Rich's markup parse per change field
+    buf = [
+        f"\n📊 [bold]Diff Summary[/bold]",
+        f"From: [cyan]{diff.from_report}[/cyan]",
+        f"To:   [cyan]{diff.to_report}[/cyan]",
+        "",
+    ]
+
     if not diff.changes:
-        console.print("✓ [green]No changes detected[/green] - reports are identical.")
+        buf.append("✓ [green]No changes detected[/green] - reports are identical.")
+        console.print("\n".join(buf))
         return
-    
-    console.print(f"Total changes: [yellow]{len(diff.changes)}[/yellow]\n")
-    
+
+    buf.append(f"Total changes: [yellow]{len(diff.changes)}[/yellow]\n")
+
     # Group by section
-    sections = {}
+    sections = defaultdict(list)
     for change in diff.changes:
-        if change.section not in sections:
-            sections[change.section] = []
         sections[change.section].append(change)
-    
+
     # Display by section
     section_titles = {
         'capabilities': '📦 Capability Changes',
@@ -140,107 +219,119 @@ def _display_diff_summary(diff) -> None:
         'recommendations': '💡 Recommendation Changes',
         'run_command': '▶ Run Command Changes'
     }
-    
+
     for section_key in ['capabilities', 'intent', 'checks', 'recommendations', 'run_command']:
         if section_key in sections:
-            console.print(f"[bold]{section_titles[section_key]}[/bold]")
-            
+            buf.append(f"[bold]{section_titles[section_key]}[/bold]")
+
             for change in sections[section_key]:
+                # Escape report-supplied values so the markup parser never
+                # has to treat them as style tags
                 symbol = _get_change_symbol_colored(change.change_type)
-                console.print(f"  {symbol} {change.key}")
-                
+                buf.append(f"  {symbol} {escape(change.key)}")
+
                 if change.before:
-                    console.print(f"    [dim]Before: {change.before}[/dim]")
+                    buf.append(f"    [dim]Before: {escape(str(change.before))}[/dim]")
                 if change.after:
-                    console.print(f"    [dim]After:  {change.after}[/dim]")
-            
-            console.print()
+                    buf.append(f"    [dim]After:  {escape(str(change.after))}[/dim]")
+
+            buf.append("")
+
+    console.print("\n".join(buf))
 
 
 def _display_policy_result(result) -> None:
     """Display policy evaluation result"""
-    
+    buf = []
+
     # Header with status
     if result.status == "PASS":
-        console.print("🟢 [bold green]Policy Evaluation: PASS[/bold green]")
-        console.print(f"  {result.rules_evaluated} rules evaluated, {result.changes_checked} changes checked")
-        console.print("  No violations detected")
-    
+        buf.append("🟢 [bold green]Policy Evaluation: PASS[/bold green]")
+        buf.append(f"  {result.rules_evaluated} rules evaluated, {result.changes_checked} changes checked")
+        buf.append("  No violations detected")
+
     elif result.status == "WARN":
-        console.print("🟡 [bold yellow]Policy Evaluation: WARN[/bold yellow]")
-        console.print(f"  {result.rules_evaluated} rules evaluated, {result.changes_checked} changes checked")
-        console.print(f"  {len(result.violations)} warning(s) detected\n")
-        
-        _display_violations(result.violations)
-    
+        buf.append("🟡 [bold yellow]Policy Evaluation: WARN[/bold yellow]")
+        buf.append(f"  {result.rules_evaluated} rules evaluated, {result.changes_checked} changes checked")
+        buf.append(f"  {len(result.violations)} warning(s) detected\n")
+
+        _append_violations(buf, result.violations)
+
     elif result.status == "FAIL":
-        console.print("🛑 [bold red]Policy Evaluation: FAIL[/bold red]")
-        console.print(f"  {result.rules_evaluated} rules evaluated, {result.changes_checked} changes checked")
-        console.print(f"  {len(result.violations)} violation(s) detected\n")
-        
-        _display_violations(result.violations)
+        buf.append("🛑 [bold red]Policy Evaluation: FAIL[/bold red]")
+        buf.append(f"  {result.rules_evaluated} rules evaluated, {result.changes_checked} changes checked")
+        buf.append(f"  {len(result.violations)} violation(s) detected\n")
 
+        _append_violations(buf, result.violations)
+
+    if buf:
+        console.print("\n".join(buf))
+
+
+def _append_violations(buf, violations) -> None:
+    """Append policy violation lines to a display buffer"""
+
+    buf.append("[bold]Violations:[/bold]\n")
 
-def _display_violations(violations) -> None:
-    """Display policy violations"""
-    
-    console.print("[bold]Violations:[/bold]\n")
-    
     for violation in violations:
         # Symbol based on action
         symbol = "✖" if violation.action == "FAIL" else "⚠"
         color = "red" if violation.action == "FAIL" else "yellow"
-        
-        console.print(f"  [{color}]{symbol} {violation.rule_id}[/{color}]")
-        console.print(f"    {violation.rule_description}")
-        console.print(f"    Change: [cyan]{violation.diff_item.key}[/cyan]")
-        
+
+        buf.append(f"  [{color}]{symbol} {violation.rule_id}[/{color}]")
+        buf.append(f"    {violation.rule_description}")
+        buf.append(f"    Change: [cyan]{violation.diff_item.key}[/cyan]")
+
         if violation.diff_item.before:
-            console.print(f"    Before: [dim]{violation.diff_item.before}[/dim]")
+            buf.append(f"    Before: [dim]{violation.diff_item.before}[/dim]")
         if violation.diff_item.after:
-            console.print(f"    After:  [dim]{violation.diff_item.after}[/dim]")
-        
-        console.print()
+            buf.append(f"    After:  [dim]{violation.diff_item.after}[/dim]")
+
+        buf.append("")
 
 
 def _display_policy_explanation(explanation) -> None:
     """Display policy explanation"""
-    
-    console.print("📖 [bold]Policy Explanation[/bold]")
-    console.print(f"  {explanation.rules_matched} of {explanation.rules_evaluated} rules matched")
-    console.print()
-    
+    buf = [
+        "📖 [bold]Policy Explanation[/bold]",
+        f"  {explanation.rules_matched} of {explanation.rules_evaluated} rules matched",
+        "",
+    ]
+
     for trace in explanation.rules:
         # Rule ID
-        console.print(f"[bold]Rule: {trace.rule_id}[/bold]")
-        
+        buf.append(f"[bold]Rule: {trace.rule_id}[/bold]")
+
         # Status with symbol
         if not trace.evaluated:
-            console.print("  Status: [dim]⏭ SKIPPED (disabled)[/dim]")
+            buf.append("  Status: [dim]⏭ SKIPPED (disabled)[/dim]")
         elif trace.matched:
             if trace.action == "FAIL":
-                console.print(f"  Status: [red]❌ MATCHED ({trace.action})[/red]")
+                buf.append(f"  Status: [red]❌ MATCHED ({trace.action})[/red]")
             else:
-                console.print(f"  Status: [yellow]⚠️  MATCHED ({trace.action})[/yellow]")
+                buf.append(f"  Status: [yellow]⚠️  MATCHED ({trace.action})[/yellow]")
         else:
-            console.print("  Status: [green]✓ NOT MATCHED[/green]")
-        
+            buf.append("  Status: [green]✓ NOT MATCHED[/green]")
+
         # Reason
-        console.print("  Reason:")
+        buf.append("  Reason:")
         for line in trace.reason.split('\n'):
             if line.strip():
-                console.print(f"    [dim]{line}[/dim]")
-        
-        console.print()
+                buf.append(f"    [dim]{line}[/dim]")
+
+        buf.append("")
+
+    console.print("\n".join(buf))
+
+
+# Colored change symbols, prebuilt so per-change markup is not rebuilt
+_CHANGE_SYMBOLS = {
+    "added": "[green]+[/green]",
+    "removed": "[red]-[/red]",
+    "changed": "[yellow]~[/yellow]",
+}
 
 
 def _get_change_symbol_colored(change_type: str) -> str:
     """Get colored symbol for change type"""
-    if change_type == "added":
-        return "[green]+[/green]"
-    elif change_type == "removed":
-        return "[red]-[/red]"
-    elif change_type == "changed":
-        return "[yellow]~[/yellow]"
-    else:
-        return "○"
+    return _CHANGE_SYMBOLS.get(change_type, "○")
@@ -1,22 +1,41 @@
 """Explain command for Q&A over deterministic artifacts."""
 
+import hashlib
 import os
 import sys
+import time
 from pathlib import Path
 from rich.console import Console
 
-# Import backend modules
-try:
-    from pyready.qa.classifier import QuestionClassifier, QuestionType
-    from pyready.qa.artifact_selector import ArtifactSelector
-    from pyready.qa.answer_generator import AnswerGenerator
-    from pyready.run_detection.detector import RunCommandDetector
-    QA_AVAILABLE = True
-except ImportError:
-    QA_AVAILABLE = False
-
 console = Console()
 
+_GROQ_MODEL = "llama-3.3-70b-versatile"
+
+# On-disk cache for run-command explanations: the same (model, command,
+# project) prompt yields the same answer, so repeated `check --explain`
+# runs skip the 1-3 s LLM round-trip
+_GROQ_CACHE_DIR = Path.home() / ".cache" / "pyready" / "groq"
+_GROQ_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+
+def _read_cached_explanation(cache_file: Path) -> str | None:
+    """Return a cached explanation if present and fresh, else None"""
+    try:
+        if time.time() - cache_file.stat().st_mtime < _GROQ_CACHE_TTL_SECONDS:
+            return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    return None
+
+
+def _write_cached_explanation(cache_file: Path, explanation: str) -> None:
+    """Persist an explanation to the cache (best-effort)"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(explanation, encoding="utf-8")
+    except OSError:
+        pass
+
 
 def is_groq_available() -> bool:
     """
@@ -39,7 +58,14 @@ def explain_question(project_path: Path, question: str) -> None:
         project_path: Path to project directory
         question: User's question
     """
-    if not QA_AVAILABLE:
+    # Backend modules are imported here rather than at module top so
+    # importing the CLI does not pay for the qa/run-detection subtrees
+    try:
+        from pyready.qa.classifier import QuestionClassifier, QuestionType
+        from pyready.qa.artifact_selector import ArtifactSelector
+        from pyready.qa.answer_generator import AnswerGenerator
+        from pyready.run_detection.detector import RunCommandDetector
+    except ImportError:
         console.print("\n❌ [red]Q&A system unavailable[/red]")
         console.print("  [dim]Backend modules not found[/dim]\n")
         return
@@ -152,15 +178,23 @@ def explain_run_command(run_command: str, project_path: Path) -> str | None:
     if not is_groq_available():
         return None
     
+    # Serve identical prompts from the disk cache before paying a round-trip
+    project_name = project_path.name
+    cache_key = hashlib.sha1(
+        f"{_GROQ_MODEL}|{run_command}|{project_name}".encode()
+    ).hexdigest()
+    cache_file = _GROQ_CACHE_DIR / f"{cache_key}.txt"
+
+    cached = _read_cached_explanation(cache_file)
+    if cached is not None:
+        return cached
+
     try:
         from groq import Groq
-        
+
         # Initialize Groq client
         client = Groq(api_key=os.getenv("GROQ_API_KEY"))
-        
-        # Build prompt with deterministic context
-        project_name = project_path.name
-        
+
         prompt = f"""You are explaining a detected run command for a Python project.
 
 Project: {project_name}
@@ -174,7 +208,7 @@ Keep it practical and specific to the command. Do not add warnings or recommenda
         
         # PHASE 14.5: Call Groq with explicit timeout
         response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
+            model=_GROQ_MODEL,
             messages=[
                 {"role": "system", "content": "You are a Python development assistant. Provide clear, concise explanations."},
                 {"role": "user", "content": prompt}
@@ -183,8 +217,10 @@ Keep it practical and specific to the command. Do not add warnings or recommenda
             max_tokens=500,
             timeout=10  # PHASE 14.5: Explicit 10-second timeout
         )
-        
-        return response.choices[0].message.content.strip()
+
+        explanation = response.choices[0].message.content.strip()
+        _write_cached_explanation(cache_file, explanation)
+        return explanation
     
     except Exception as e:
         # PHASE 14.5: Silent fallback instead of crash
@@ -7,20 +7,30 @@ load_dotenv()
 
 import typer
 from pathlib import Path
-from rich.console import Console
 
-from pyready.cli.check import check_environment
-from pyready.cli.explain import explain_question
-from pyready.cli.diff import diff_command
 from pyready.project_detection import detect_project_type, ProjectType
 
+# Command implementations (check/explain/diff) are imported inside each
+# command body: they transitively pull in Rich, pydantic schemas, the
+# policy engine and the qa backend, which `pyready --help` and unrelated
+# commands should not pay for.
+
 app = typer.Typer(
     name="onboardai",
     help="PyReady CLI - Project environment checker and assistant",
     add_completion=False,
 )
 
-console = Console()
+_console = None
+
+
+def _get_console():
+    """Create the shared Rich console on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 
 @app.command()
@@ -51,16 +61,18 @@ def check(
     With --explain flag, adds AI-assisted explanations of detected commands.
     With --output flag, exports report to JSON or Markdown format.
     """
+    from pyready.cli.check import check_environment
+
     project_path = Path(path).resolve()
-    
+
     if not project_path.exists():
         typer.echo(f"Error: Directory '{path}' does not exist.", err=True)
         raise typer.Exit(1)
-    
+
     if not project_path.is_dir():
         typer.echo(f"Error: '{path}' is not a directory.", err=True)
         raise typer.Exit(1)
-    
+
     # Detect project type first
     project_type = detect_project_type(project_path)
     
@@ -76,35 +88,49 @@ def check(
 
 def _display_project_detection(project_path: Path, project_type: ProjectType) -> None:
     """Display project type detection results"""
+    import os
+
+    console = _get_console()
     console.print(f"\n🔍 [bold]Project type detected:[/bold] [cyan]{project_type.value}[/cyan]")
     console.print("[dim]Evidence:[/dim]")
-    
+
+    # One directory listing replaces the per-marker exists() stat calls
+    try:
+        names = {entry.name for entry in os.scandir(project_path)}
+    except OSError:
+        names = set()
+
     if project_type == ProjectType.POETRY:
-        if (project_path / "pyproject.toml").exists():
+        if "pyproject.toml" in names:
             console.print("  • pyproject.toml")
             console.print("  • [tool.poetry] section found")
-    
+
     elif project_type == ProjectType.PIP_VENV:
-        if (project_path / "requirements.txt").exists():
+        if "requirements.txt" in names:
             console.print("  • requirements.txt")
-        if (project_path / "requirements-dev.txt").exists():
+        if "requirements-dev.txt" in names:
             console.print("  • requirements-dev.txt")
-        
-        req_dir = project_path / "requirements"
-        if req_dir.is_dir():
-            txt_files = list(req_dir.glob("*.txt"))
-            for f in txt_files[:3]:  # Show max 3
-                console.print(f"  • requirements/{f.name}")
-    
+
+        if "requirements" in names:
+            try:
+                txt_names = sorted(
+                    entry.name for entry in os.scandir(project_path / "requirements")
+                    if entry.name.endswith(".txt")
+                )
+            except (OSError, NotADirectoryError):
+                txt_names = []
+            for name in txt_names[:3]:  # Show max 3
+                console.print(f"  • requirements/{name}")
+
     elif project_type == ProjectType.SETUPTOOLS:
-        if (project_path / "setup.py").exists():
+        if "setup.py" in names:
             console.print("  • setup.py")
-        if (project_path / "setup.cfg").exists():
+        if "setup.cfg" in names:
             console.print("  • setup.cfg")
-    
+
     elif project_type == ProjectType.UNKNOWN:
         console.print("  • No Python project markers found")
-    
+
     console.print()  # Blank line
 
 
@@ -159,6 +185,8 @@ def diff(
       pyready diff report-old.json report-new.json --policy .pyready-policy.yml
       pyready diff report-old.json report-new.json --policy policy.yml --explain-policy
     """
+    from pyready.cli.diff import diff_command
+
     old_path = Path(old_report).resolve()
     new_path = Path(new_report).resolve()
     
@@ -211,6 +239,8 @@ def explain(
     
     Requires GROQ_API_KEY environment variable.
     """
+    from pyready.cli.explain import explain_question
+
     project_path = Path(path).resolve()
     
     if not project_path.exists():
@@ -1,10 +1,20 @@
 """Dependency installation checker"""
 
+import re
 import subprocess
 import sys
 from pathlib import Path
 from typing import Set
-import tomli
+
+from pyready.env_checker.fileio import load_toml, read_file_bytes
+
+# First character that ends a package name: extras bracket, version
+# specifier, direct reference, environment marker or whitespace
+_SPEC_RE = re.compile(r"[\[><=!~@;\s]")
+
+# Requirement line: skips blank lines, comments and option lines (-r/-e/...),
+# and drops trailing comments/whitespace from the captured spec
+_REQ_LINE_RE = re.compile(r"^[ \t]*([^#\s-][^#\r\n]*?)[ \t]*(?:#|$)", re.MULTILINE)
 
 
 class DependencyChecker:
@@ -39,23 +49,19 @@ class DependencyChecker:
                 }
         
         installed_deps = self._get_installed_packages()
-        
-        missing = []
-        installed = []
-        
+
+        # Normalize once, then split installed/missing with two C-level
+        # set operations instead of per-dep membership tests
+        name_to_raw = {}
         for dep in required_deps:
             if not dep or not dep.strip():
                 continue
-                
             pkg_name = self._extract_package_name(dep)
-            
-            if not pkg_name:
-                continue
-            
-            if pkg_name.lower() in installed_deps:
-                installed.append(dep)
-            else:
-                missing.append(dep)
+            if pkg_name:
+                name_to_raw[pkg_name.lower()] = dep
+
+        installed = sorted(name_to_raw[n] for n in name_to_raw.keys() & installed_deps)
+        missing = sorted(name_to_raw[n] for n in name_to_raw.keys() - installed_deps)
         
         total_deps = len(installed) + len(missing)
         
@@ -99,9 +105,8 @@ class DependencyChecker:
         deps = set()
         
         try:
-            with open(path, "rb") as f:
-                data = tomli.load(f)
-            
+            data = load_toml(path)
+
             if "tool" in data and "poetry" in data["tool"]:
                 poetry_deps = data["tool"]["poetry"].get("dependencies", {})
                 for pkg_name, version_spec in poetry_deps.items():
@@ -124,59 +129,50 @@ class DependencyChecker:
         deps = set()
         
         try:
-            encodings = ['utf-8', 'utf-16', 'utf-16-le', 'utf-16-be']
-            content = None
-            
-            for encoding in encodings:
-                try:
-                    with open(path, "r", encoding=encoding) as f:
-                        content = f.read()
-                    break
-                except (UnicodeDecodeError, UnicodeError):
-                    continue
-            
-            if not content:
-                return deps
-            
-            for line in content.split('\n'):
-                if "#" in line:
-                    line = line.split("#")[0]
-                
-                line = line.strip()
-                
-                if not line or line.startswith("-"):
-                    continue
-                
-                if line:
-                    deps.add(line)
+            # Sniff the BOM once instead of retrying whole-file decodes
+            # across four candidate encodings
+            raw = read_file_bytes(path)
+
+            if raw.startswith(b'\xff\xfe') or raw.startswith(b'\xfe\xff'):
+                content = raw.decode('utf-16')
+            elif raw.startswith(b'\xef\xbb\xbf'):
+                content = raw.decode('utf-8-sig')
+            else:
+                content = raw.decode('utf-8', 'replace')
+
+            deps.update(_REQ_LINE_RE.findall(content))
         except Exception:
             pass
-        
+
         return deps
     
     def _extract_package_name(self, dep_string: str) -> str:
         """Extract package name from dependency string"""
         if not dep_string:
             return ""
-        
+
         result = dep_string.strip()
-        
-        # Handle extras like pydantic[email]
-        if '[' in result:
-            result = result.split('[')[0].strip()
-        
-        # Handle version specifiers
-        for sep in ['>=', '<=', '==', '!=', '~=', '>', '<', '@', ';']:
-            if sep in result:
-                result = result.split(sep)[0].strip()
-                break
-        
+
+        # One C-level scan finds the first extras bracket, specifier or
+        # marker instead of trying each separator in turn
+        match = _SPEC_RE.search(result)
+        if match:
+            return result[:match.start()].rstrip()
+
         return result
     
+    # Enumerates installed distribution names without loading pip, which
+    # alone costs ~150 ms of import time in the child interpreter
+    _LIST_PACKAGES_SCRIPT = (
+        "import importlib.metadata, json, sys; "
+        "json.dump([d.metadata['Name'] for d in importlib.metadata.distributions() "
+        "if d.metadata['Name']], sys.stdout)"
+    )
+
     def _get_installed_packages(self) -> Set[str]:
         """Get list of installed packages in the target project's environment"""
         installed = set()
-        
+
         # Try to find target venv's Python
         target_python = None
         for candidate in [".venv", "venv", "env"]:
@@ -188,25 +184,38 @@ class DependencyChecker:
                 elif (venv_path / "bin" / "python").exists():
                     target_python = str(venv_path / "bin" / "python")
                     break
-        
-        # If no target venv found, use current Python
+
+        # If no target venv found, enumerate the current interpreter's
+        # environment in-process: no subprocess, no JSON round-trip
         if not target_python:
-            target_python = sys.executable
-        
+            try:
+                from importlib.metadata import distributions
+                for dist in distributions():
+                    name = dist.metadata["Name"]
+                    if name:
+                        installed.add(name.lower())
+            except Exception:
+                pass
+            return installed
+
         try:
             result = subprocess.run(
-                [target_python, "-m", "pip", "list", "--format=json"],
+                [target_python, "-c", self._LIST_PACKAGES_SCRIPT],
                 capture_output=True,
                 text=True,
                 timeout=10
             )
-            
+
             if result.returncode == 0:
-                import json
-                packages = json.loads(result.stdout)
-                for pkg in packages:
-                    installed.add(pkg["name"].lower())
+                try:
+                    import orjson
+                    packages = orjson.loads(result.stdout.encode())
+                except ImportError:
+                    import json
+                    packages = json.loads(result.stdout)
+                for name in packages:
+                    installed.add(name.lower())
         except Exception:
             pass
-        
+
         return installed
@@ -1,8 +1,70 @@
 """Environment variables checker"""
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Set, List
+from typing import FrozenSet, Optional, Set, Tuple, List
+
+from pyready.env_checker.fileio import read_file_bytes
+
+# Valid env var name: the anchored fullmatch is a single pass with no
+# allocation, unlike the replace().replace().isalnum() chain it replaces
+_VAR_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+
+@lru_cache(maxsize=256)
+def _parse_env_file_cached(path_str: str, mtime_ns: int) -> FrozenSet[str]:
+    """
+    Parse and memoize the variable names of one env file.
+
+    Keyed on (path, mtime) so repeated checks within a process reuse the
+    parse while edits to the file invalidate it.
+    """
+    vars_set = set()
+
+    try:
+        # One read (mmap-backed for large generated files) and one
+        # decode instead of paying the text-mode decoder per line
+        data = read_file_bytes(path_str).decode("utf-8", "ignore")
+    except Exception:
+        return frozenset()
+
+    # Bulk-strip comment markers and whitespace in a list comprehension,
+    # keeping the loop body to the partition + validation work only
+    stripped = [raw.lstrip("# \t").rstrip() for raw in data.splitlines()]
+
+    for line in stripped:
+        if not line:
+            continue
+
+        # partition replaces the separate "=" membership scan plus
+        # split()[0], which allocated a throwaway list per line
+        var_name, sep, _ = line.partition("=")
+        if sep:
+            var_name = var_name.rstrip()
+            # Validate it's a valid variable name (alphanumeric + underscore/hyphen)
+            if var_name and _VAR_NAME_RE.fullmatch(var_name):
+                vars_set.add(var_name)
+
+    return frozenset(vars_set)
+
+
+# Shared result shape: copying this small dict and updating the fields
+# that differ is cheaper than building a five-key literal per return
+_RESULT_TEMPLATE = {
+    "status": "",
+    "message": "",
+    "details": None,
+    "missing_vars": (),
+    "set_vars": (),
+}
+
+
+def _make_result(**fields) -> dict:
+    result = _RESULT_TEMPLATE.copy()
+    result.update(fields)
+    return result
 
 
 class EnvVarsChecker:
@@ -10,6 +72,14 @@ class EnvVarsChecker:
     
     def __init__(self, repo_path: str):
         self.repo_path = Path(repo_path)
+        self._required_vars: Optional[FrozenSet[str]] = None
+
+        # Plain-string paths built once: os.path.join is cheaper than
+        # Path.__truediv__ and these are reused on every check()
+        rp = str(self.repo_path)
+        self._env_file = os.path.join(rp, ".env")
+        self._env_example = os.path.join(rp, ".env.example")
+        self._env_template = os.path.join(rp, ".env.template")
     
     def check(self) -> dict:
         """
@@ -18,106 +88,116 @@ class EnvVarsChecker:
         Returns:
             dict with keys: status, message, details, missing_vars, set_vars
         """
-        # Check what env files exist
-        env_file = self.repo_path / ".env"
-        env_example = self.repo_path / ".env.example"
-        env_template = self.repo_path / ".env.template"
-        
-        has_env = env_file.exists()
-        has_example = env_example.exists()
-        has_template = env_template.exists()
-        
-        # Get required vars from example/template files
-        required_vars = self._get_required_env_vars()
+        # One directory listing answers all three file-presence questions
+        # instead of a stat call per candidate
+        try:
+            names = {e.name for e in os.scandir(self.repo_path) if e.is_file()}
+        except OSError:
+            names = set()
+
+        has_env = ".env" in names
+        has_example = ".env.example" in names
+        has_template = ".env.template" in names
+
+        # One dispatch parses the example/template files and, when .env
+        # exists, the actual file too — no second open round-trip later
+        required_vars, set_vars_in_env = self._scan_env_files(
+            has_example, has_template, include_actual=has_env
+        )
         
         # Case 1: No env files at all
         if not has_env and not has_example and not has_template:
-            return {
-                "status": "PASS",
-                "message": "Environment variables: no requirements found",
-                "details": "No .env, .env.example, or .env.template files found",
-                "missing_vars": [],
-                "set_vars": []
-            }
+            return _make_result(
+                status="PASS",
+                message="Environment variables: no requirements found",
+                details="No .env, .env.example, or .env.template files found",
+            )
         
         # Case 2: Has .env but no example/template (can't validate)
         if has_env and not required_vars:
-            # Count vars in .env
-            env_vars = self._parse_env_file(env_file)
-            return {
-                "status": "PASS",
-                "message": f"Environment variables: .env found with {len(env_vars)} variables",
-                "details": "No .env.example or .env.template to validate against",
-                "missing_vars": [],
-                "set_vars": list(env_vars)
-            }
+            env_vars = set_vars_in_env
+            return _make_result(
+                status="PASS",
+                message=f"Environment variables: .env found with {len(env_vars)} variables",
+                details="No .env.example or .env.template to validate against",
+                set_vars=sorted(env_vars),
+            )
         
         # Case 3: Has example/template but no .env
         if required_vars and not has_env:
-            return {
-                "status": "FAIL",
-                "message": "Environment variables: .env file missing",
-                "details": f"Found {len(required_vars)} required variables in .env.example/.env.template but .env not found",
-                "missing_vars": list(required_vars),
-                "set_vars": []
-            }
+            return _make_result(
+                status="FAIL",
+                message="Environment variables: .env file missing",
+                details=f"Found {len(required_vars)} required variables in .env.example/.env.template but .env not found",
+                missing_vars=sorted(required_vars),
+            )
         
         # Case 4: Has both - validate
-        set_vars_in_env = self._parse_env_file(env_file)
-        
-        missing = []
-        set_vars = []
-        
-        for var in required_vars:
-            if var in set_vars_in_env:
-                set_vars.append(var)
-            else:
-                missing.append(var)
+        # C-level set difference/intersection replace the Python-level
+        # membership loop; sort once so the "Missing: ..." preview is
+        # stable across runs rather than set-iteration order
+        missing = sorted(required_vars - set_vars_in_env)
+        set_vars = sorted(required_vars & set_vars_in_env)
         
         if not missing:
-            return {
-                "status": "PASS",
-                "message": f"Environment variables: all {len(required_vars)} variables set in .env",
-                "details": None,
-                "missing_vars": [],
-                "set_vars": set_vars
-            }
+            return _make_result(
+                status="PASS",
+                message=f"Environment variables: all {len(required_vars)} variables set in .env",
+                set_vars=set_vars,
+            )
         else:
-            return {
-                "status": "FAIL",
-                "message": f"Environment variables: {len(missing)} missing from .env",
-                "details": f"Missing: {', '.join(missing[:5])}{'...' if len(missing) > 5 else ''}",
-                "missing_vars": missing,
-                "set_vars": set_vars
-            }
+            return _make_result(
+                status="FAIL",
+                message=f"Environment variables: {len(missing)} missing from .env",
+                details=f"Missing: {', '.join(missing[:5])}{'...' if len(missing) > 5 else ''}",
+                missing_vars=missing,
+                set_vars=set_vars,
+            )
     
-    def _get_required_env_vars(self) -> Set[str]:
+    def _scan_env_files(
+        self,
+        has_example: Optional[bool] = None,
+        has_template: Optional[bool] = None,
+        include_actual: bool = False,
+    ) -> Tuple[Set[str], Optional[FrozenSet[str]]]:
         """
-        Get list of required environment variables
-        
-        Scans:
-        - .env.example
-        - .env.template
-        
+        Scan all env files of interest in one dispatch
+
+        Parses .env.example/.env.template for required variable names and,
+        when include_actual is set, .env for the variables actually set.
+        Callers that already listed the directory pass the presence flags
+        so this method issues no stat calls of its own.
+
         Returns:
-            Set of variable names
+            (required_vars, actual_vars); actual_vars is None unless
+            include_actual was requested
         """
+        actual_vars = self._parse_env_file(self._env_file) if include_actual else None
+
+        # Required vars are cached on the instance: check() may consult
+        # them more than once and the files do not change within a run
+        if self._required_vars is not None:
+            return set(self._required_vars), actual_vars
+
         vars_set = set()
-        
+
         # Check .env.example
-        env_example = self.repo_path / ".env.example"
-        if env_example.exists():
-            vars_set.update(self._parse_env_file(env_example))
-        
+        if has_example is None:
+            has_example = os.path.exists(self._env_example)
+        if has_example:
+            vars_set.update(self._parse_env_file(self._env_example))
+
         # Check .env.template
-        env_template = self.repo_path / ".env.template"
-        if env_template.exists():
-            vars_set.update(self._parse_env_file(env_template))
-        
-        return vars_set
+        if has_template is None:
+            has_template = os.path.exists(self._env_template)
+        if has_template:
+            vars_set.update(self._parse_env_file(self._env_template))
+
+        self._required_vars = frozenset(vars_set)
+        return vars_set, actual_vars
     
     @staticmethod
-    def _parse_env_file(path: Path) -> Set[str]:
+    def _parse_env_file(path) -> FrozenSet[str]:
         """
         Parse environment variable names from .env file
         
@@ -129,29 +209,9 @@ class EnvVarsChecker:
         Returns:
             Set of variable names
         """
-        vars_set = set()
-        
         try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    line = line.strip()
-                    
-                    # Skip empty lines
-                    if not line:
-                        continue
-                    
-                    # Remove leading comment marker for commented lines
-                    if line.startswith("#"):
-                        line = line[1:].strip()
-                    
-                    # Look for VAR=value pattern
-                    if "=" in line:
-                        var_name = line.split("=")[0].strip()
-                        # Validate it's a valid variable name (alphanumeric + underscore/hyphen)
-                        if var_name and var_name.replace("_", "").replace("-", "").isalnum():
-                            vars_set.add(var_name)
-        
-        except Exception:
-            pass
-        
-        return vars_set
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return frozenset()
+
+        return _parse_env_file_cached(os.fspath(path), mtime_ns)
@@ -9,6 +9,7 @@ This module decides:
 Rules are deterministic and based on detected capabilities only.
 """
 
+from functools import cached_property
 from typing import Tuple, Optional
 from pyready.schemas.capability_schema import ProjectCapabilities
 
@@ -28,6 +29,7 @@ class CheckExpectations:
     # Python Version Check
     # ========================================================================
     
+    @cached_property
     def should_check_python_version(self) -> Tuple[bool, Optional[str]]:
         """
         Determine if Python version check should run.
@@ -55,6 +57,7 @@ class CheckExpectations:
     # Virtual Environment Check
     # ========================================================================
     
+    @cached_property
     def should_check_virtual_environment(self) -> Tuple[bool, Optional[str]]:
         """
         Determine if virtual environment check should run.
@@ -84,6 +87,7 @@ class CheckExpectations:
     # Dependencies Check
     # ========================================================================
     
+    @cached_property
     def should_check_dependencies(self) -> Tuple[bool, Optional[str]]:
         """
         Determine if dependency check should run.
@@ -111,6 +115,7 @@ class CheckExpectations:
         """
         return "WARN"
     
+    @cached_property
     def can_verify_dependencies(self) -> bool:
         """
         Check if dependencies can actually be verified.
@@ -131,6 +136,7 @@ class CheckExpectations:
     # Environment Variables Check
     # ========================================================================
     
+    @cached_property
     def should_check_environment_variables(self) -> Tuple[bool, Optional[str]]:
         """
         Determine if environment variables check should run.
@@ -0,0 +1,74 @@
+"""Low-level file reading and parse caching shared by the env checkers"""
+
+import mmap
+import os
+import sys
+from functools import lru_cache
+
+# Stdlib tomllib (3.11+) avoids resolving the third-party package from
+# site-packages at startup; tomli is the same parser for older runtimes
+if sys.version_info >= (3, 11):
+    import tomllib as tomli
+else:
+    import tomli
+
+# Above this size, mapping the file avoids the extra user-space copy of
+# a buffered read; below it, a single os.read is cheaper than the mmap
+# setup cost
+_MMAP_THRESHOLD = 64 * 1024
+
+# O_NOATIME skips the access-time update syscall where supported
+_O_FLAGS = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
+
+
+def read_file_bytes(path) -> bytes:
+    """
+    Read a whole file as bytes with one open/read round-trip.
+
+    Files at or above 64 KiB are memory-mapped; smaller files are read
+    directly into a pre-sized buffer. Raises OSError on failure, matching
+    open().
+    """
+    try:
+        fd = os.open(path, _O_FLAGS)
+    except OSError:
+        # O_NOATIME is owner-only on Linux; retry without it
+        fd = os.open(path, os.O_RDONLY)
+
+    try:
+        size = os.fstat(fd).st_size
+
+        if size >= _MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:]
+
+        data = os.read(fd, size)
+        # Regular files return the full size in one read; top up on the
+        # rare short read
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=64)
+def _load_toml_cached(path_str: str, mtime_ns: int) -> dict:
+    with open(path_str, "rb") as f:
+        return tomli.load(f)
+
+
+def load_toml(path) -> dict:
+    """
+    Parse a TOML file with memoization keyed on (path, mtime).
+
+    PythonVersionChecker and DependencyChecker both read the same
+    pyproject.toml during one run; the second parse is served from cache.
+    The returned dict is shared — callers must treat it as read-only.
+    Raises OSError/TOMLDecodeError on failure, matching tomli.load.
+    """
+    st = os.stat(path)
+    return _load_toml_cached(str(path), st.st_mtime_ns)
@@ -1,6 +1,7 @@
 """Environment checker orchestrator"""
 
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -13,6 +14,11 @@ from pyready.env_checker.env_vars_checker import EnvVarsChecker
 from pyready.env_checker.expectations import CheckExpectations, create_skip_result, downgrade_to_warn
 from pyready.project_detection.capabilities import CapabilityDetector
 
+# The OS cannot change within a process; resolve it once at import
+# instead of a platform.system() call per EnvironmentChecker instance
+_SYSTEM = platform.system().lower()
+_OS_TYPE = {"windows": "windows", "darwin": "macos", "linux": "linux"}.get(_SYSTEM, "linux")
+
 
 class EnvironmentChecker:
     """Orchestrates all environment checks with capability-aware expectations"""
@@ -42,11 +48,19 @@ class EnvironmentChecker:
         # Create expectation policy based on capabilities
         expectations = CheckExpectations(capabilities)
         
-        # Run checks with expectations
-        checks.append(self._check_python_version(expectations))
-        checks.append(self._check_virtual_environment(expectations))
-        checks.extend(self._check_dependencies(expectations))
-        checks.extend(self._check_env_vars(expectations))
+        # The four checks touch disjoint files (and DependencyChecker may
+        # spawn a subprocess), so run them concurrently and collect in the
+        # fixed display order; threads suffice since the work is I/O-bound
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            python_future = pool.submit(self._check_python_version, expectations)
+            venv_future = pool.submit(self._check_virtual_environment, expectations)
+            deps_future = pool.submit(self._check_dependencies, expectations)
+            env_vars_future = pool.submit(self._check_env_vars, expectations)
+
+            checks.append(python_future.result())
+            checks.append(venv_future.result())
+            checks.extend(deps_future.result())
+            checks.extend(env_vars_future.result())
         
         summary = self._calculate_summary(checks)
         
@@ -61,7 +75,7 @@ class EnvironmentChecker:
         """Check Python version with capability awareness"""
         
         # Consult expectations
-        should_run, skip_reason = expectations.should_check_python_version()
+        should_run, skip_reason = expectations.should_check_python_version
         
         if not should_run:
             return CheckResult(
@@ -98,7 +112,7 @@ class EnvironmentChecker:
         """Check virtual environment with capability awareness"""
         
         # Consult expectations
-        should_run, skip_reason = expectations.should_check_virtual_environment()
+        should_run, skip_reason = expectations.should_check_virtual_environment
         
         if not should_run:
             return CheckResult(
@@ -136,7 +150,7 @@ class EnvironmentChecker:
         """Check dependencies with capability awareness"""
         
         # Consult expectations
-        should_run, skip_reason = expectations.should_check_dependencies()
+        should_run, skip_reason = expectations.should_check_dependencies
         
         if not should_run:
             return [CheckResult(
@@ -148,7 +162,7 @@ class EnvironmentChecker:
             )]
         
         # Check if we can actually verify dependencies
-        if not expectations.can_verify_dependencies():
+        if not expectations.can_verify_dependencies:
             return [CheckResult(
                 category="Dependencies",
                 status=CheckStatus.WARN,
@@ -224,15 +238,7 @@ class EnvironmentChecker:
     @staticmethod
     def _detect_os() -> str:
         """Detect operating system"""
-        system = platform.system().lower()
-        if system == "windows":
-            return "windows"
-        elif system == "darwin":
-            return "macos"
-        elif system == "linux":
-            return "linux"
-        else:
-            return "linux"  # Default fallback
+        return _OS_TYPE
     
     @staticmethod
     def _calculate_summary(checks: List[CheckResult]) -> dict:
@@ -1,10 +1,41 @@
 """Python version checker"""
 
+import operator
 import sys
 import re
 from pathlib import Path
 from typing import Optional, Tuple
-import tomli
+
+from pyready.env_checker.fileio import load_toml, read_file_bytes
+
+# Compiled once at import: re.match with an inline pattern pays the
+# regex-cache lookup on every call, and constraint checks run several
+# times per multi-part specifier like ">=3.9,<3.12"
+_PY_REQ_RE = re.compile(r"python\s*([>=<~!]+.*)", re.IGNORECASE)
+
+# One alternation of every supported operator, matched anchored at the
+# start of each comma-separated part: none of the branches can begin
+# mid-token, so malformed operators like "=>" fail the match outright
+# where the old [>=<~!]+ character class would capture them
+_CONSTRAINT_RE = re.compile(
+    r"(>=|<=|==|!=|~=|>|<)\s*(\d+)(?:\.(\d+))?(?:\.(\d+))?"
+)
+
+# Lightweight extraction of the two version keys pyproject.toml can
+# declare; full tomli parsing is the fallback when neither line matches
+_REQUIRES_PY_RE = re.compile(r'^\s*requires-python\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+_POETRY_PY_RE = re.compile(r'^\s*python\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+
+# Operator dispatch for constraint comparison; tuple comparison in C
+# replaces the per-operator if-elif chain
+_OPS = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
 
 
 class PythonVersionChecker:
@@ -82,10 +113,22 @@ class PythonVersionChecker:
     
     def _parse_pyproject_toml(self, path: Path) -> Optional[str]:
         """Parse Python version from pyproject.toml"""
+        # First pass: regex over the raw text. Both keys are simple
+        # string assignments in practice, so this usually avoids
+        # tokenizing the whole TOML document.
         try:
-            with open(path, "rb") as f:
-                data = tomli.load(f)
-            
+            text = read_file_bytes(path).decode("utf-8", "replace")
+        except OSError:
+            return None
+
+        match = _POETRY_PY_RE.search(text) or _REQUIRES_PY_RE.search(text)
+        if match:
+            return match.group(1)
+
+        # Ambiguous or unusual layout: fall back to the full parse
+        try:
+            data = load_toml(path)
+
             # Check Poetry format: [tool.poetry.dependencies]
             if "tool" in data and "poetry" in data["tool"]:
                 deps = data["tool"]["poetry"].get("dependencies", {})
@@ -111,7 +154,7 @@ class PythonVersionChecker:
                     line = line.strip()
                     # Look for lines like: python>=3.9
                     if line.startswith("python"):
-                        match = re.match(r"python\s*([>=<~!]+.*)", line, re.IGNORECASE)
+                        match = _PY_REQ_RE.match(line)
                         if match:
                             return match.group(1)
         except Exception:
@@ -128,18 +171,51 @@ class PythonVersionChecker:
         - >=3.9,<3.12 (multiple constraints)
         - >=3.9 (simple constraint)
         """
+        # Trivial constraints ("*", ">=3") are common in the wild; settle
+        # them with string/int comparison before involving the regex engine
+        constraint = constraint.strip()
+        if constraint in ("*", ">=0"):
+            return True
+        if constraint.startswith(">=") and "," not in constraint and "." not in constraint:
+            try:
+                return version[0] >= int(constraint[2:])
+            except ValueError:
+                return False
+
         # Handle Poetry caret operator (^)
         if constraint.startswith("^"):
             base_version = constraint[1:]
             return self._check_caret_constraint(version, base_version)
-        
-        # Handle multiple comma-separated constraints
-        if "," in constraint:
-            constraints = [c.strip() for c in constraint.split(",")]
-            return all(self._check_single_constraint(version, c) for c in constraints)
-        
-        # Single constraint
-        return self._check_single_constraint(version, constraint)
+
+        # One anchored match per comma-separated part; an unanchored
+        # findall over the whole specifier would quietly accept the
+        # valid tail of a malformed part ("=>3.9" matching as ">3.9")
+        for part in constraint.split(","):
+            match = _CONSTRAINT_RE.match(part.strip())
+            if match is None:
+                return False
+
+            op, req_major, req_minor, req_micro = match.groups()
+            req_version = (int(req_major), int(req_minor or 0), int(req_micro or 0))
+
+            # Compatible release: ~=3.9 means >=3.9,<4.0 and
+            # ~=3.9.1 means >=3.9.1,<3.10 (unmatched optional groups
+            # are None, so truthiness is the presence test)
+            if op == "~=":
+                if not req_minor:
+                    return False
+                if not req_micro:
+                    upper = (req_version[0] + 1, 0, 0)
+                else:
+                    upper = (req_version[0], req_version[1] + 1, 0)
+                if not (req_version <= version < upper):
+                    return False
+                continue
+
+            if not _OPS[op](version, req_version):
+                return False
+
+        return True
     
     def _check_caret_constraint(self, version: Tuple[int, int, int], base: str) -> bool:
         """
@@ -168,35 +244,6 @@ class PythonVersionChecker:
         except ValueError:
             return False
     
-    def _check_single_constraint(self, version: Tuple[int, int, int], constraint: str) -> bool:
-        """Check a single constraint like >=3.9 or <3.12"""
-        # Extract operator and version
-        match = re.match(r"([>=<~!]+)\s*(\d+)\.?(\d+)?\.?(\d+)?", constraint)
-        if not match:
-            return False
-        
-        operator = match.group(1)
-        req_major = int(match.group(2))
-        req_minor = int(match.group(3)) if match.group(3) else 0
-        req_micro = int(match.group(4)) if match.group(4) else 0
-        
-        req_version = (req_major, req_minor, req_micro)
-        
-        if operator == ">=":
-            return version >= req_version
-        elif operator == ">":
-            return version > req_version
-        elif operator == "<=":
-            return version <= req_version
-        elif operator == "<":
-            return version < req_version
-        elif operator == "==":
-            return version == req_version
-        elif operator == "!=":
-            return version != req_version
-        
-        return False
-    
     @staticmethod
     def _format_version(version: Tuple[int, int, int]) -> str:
         """Format version tuple as string"""
@@ -5,12 +5,30 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+# Sentinel distinguishing "not probed yet" from a cached None result
+_UNSET = object()
+
 
 class VenvDetector:
     """Detects virtual environment status"""
-    
+
+    # Old virtualenvs predating PEP 405 have no pyvenv.cfg; accepting
+    # them costs extra isdir probes on the miss path. Flip off to keep
+    # validation to the single pyvenv.cfg check.
+    _ACCEPT_LEGACY_VENVS = True
+
     def __init__(self, repo_path: str):
-        self.repo_path = Path(repo_path)
+        # Stored as a plain string: the probes below only join and list
+        # it, and os.path skips the per-operation Path allocation
+        self.repo_path = os.fspath(repo_path)
+        # Memoized _find_venv_directory result (including "no venv"):
+        # the filesystem probe is os-agnostic and the repo does not
+        # change within a run, so repeated check() calls reuse it
+        self._venv_cache = _UNSET
+
+    def refresh(self) -> None:
+        """Drop the cached probe so the next check hits the filesystem"""
+        self._venv_cache = _UNSET
     
     def check(self, os_type: str) -> dict:
         """
@@ -75,30 +93,54 @@ class VenvDetector:
         - env/
         - .env/
         """
-        candidates = [".venv", "venv", "env", ".env"]
-        
-        for candidate in candidates:
-            venv_path = self.repo_path / candidate
-            if venv_path.exists() and venv_path.is_dir():
+        if self._venv_cache is not _UNSET:
+            return self._venv_cache
+
+        self._venv_cache = self._probe_venv_directory()
+        return self._venv_cache
+
+    def _probe_venv_directory(self) -> Optional[Path]:
+        """Uncached filesystem probe behind _find_venv_directory"""
+        # One directory listing replaces the exists()/is_dir() stat pair
+        # per candidate; membership checks are then in-memory
+        try:
+            with os.scandir(self.repo_path) as it:
+                dir_names = {e.name for e in it if e.is_dir(follow_symlinks=False)}
+        except OSError:
+            return None
+
+        for candidate in (".venv", "venv", "env", ".env"):
+            if candidate in dir_names:
+                venv_path = os.path.join(self.repo_path, candidate)
                 # Verify it's actually a venv by checking for key files
                 if self._is_valid_venv(venv_path):
-                    return venv_path
-        
+                    # Wrap into Path only at the API boundary
+                    return Path(venv_path)
+
         return None
     
-    @staticmethod
-    def _is_valid_venv(path: Path) -> bool:
+    @classmethod
+    def _is_valid_venv(cls, path) -> bool:
         """
         Verify directory is a valid virtual environment
-        
+
         Checks for presence of:
-        - Scripts/ (Windows) or bin/ (Unix)
-        - pyvenv.cfg file
+        - pyvenv.cfg file (authoritative per PEP 405)
+        - Scripts/ (Windows) or bin/ (Unix) as legacy fallback
         """
-        has_scripts = (path / "Scripts").exists() or (path / "bin").exists()
-        has_config = (path / "pyvenv.cfg").exists()
-        
-        return has_scripts or has_config
+        # pyvenv.cfg is what CPython itself keys venv detection on; one
+        # isfile answers the common case without listing the directory
+        if os.path.isfile(os.path.join(path, "pyvenv.cfg")):
+            return True
+
+        if not cls._ACCEPT_LEGACY_VENVS:
+            return False
+
+        # Pre-PEP 405 virtualenvs: recognize them by their bin layout
+        return (
+            os.path.isdir(os.path.join(path, "bin"))
+            or os.path.isdir(os.path.join(path, "Scripts"))
+        )
     
     def _get_activate_command(self, venv_path: Path, os_type: str) -> str:
         """
@@ -1,5 +1,6 @@
 """Explanation generator for deterministic analysis results."""
 
+import asyncio
 from typing import Optional, List
 from pathlib import Path
 
@@ -7,6 +8,38 @@ from pyready.llm.client import LLMClient, LLMError
 from pyready.llm.groq_client import GroqClient
 from pyready.run_detection.models import RunCommandResult
 
+# Prompt templates built once at import: per call only the variable
+# slots are substituted, instead of re-assembling the whole multi-line
+# string through f-string bytecode
+_PROMPT_TMPL = """Explain this command{project_context} in 3-6 lines for a developer:
+
+Command: {command}
+
+Evidence:
+{evidence_text}
+
+Command type: {command_type}
+
+Provide a clear, technical explanation of:
+1. What this command does
+2. What the key flags/options mean (if any)
+3. When this command is typically used
+
+Do not add recommendations or speculate beyond what is shown above."""
+
+# Fully static: the no-command explanation varies only in the response
+_NO_COMMAND_PROMPT = """Explain in 3-4 lines why a Python project might not have a detectable run command, and what a developer should check:
+
+The automated detection looked for:
+- Poetry scripts in pyproject.toml
+- FastAPI applications (app = FastAPI())
+- Flask applications (app = Flask(__name__))
+- Python files with if __name__ == "__main__"
+
+None of these patterns were found.
+
+Keep the explanation practical and actionable."""
+
 
 class ExplanationGenerator:
     """
@@ -72,6 +105,59 @@ class ExplanationGenerator:
             # LLM failure should not break the CLI
             return None
     
+    async def explain_many(
+        self,
+        results: List[RunCommandResult],
+        project_name: Optional[str] = None
+    ) -> List[Optional[str]]:
+        """
+        Generate explanations for several results concurrently.
+
+        Each entry follows the same rules as explain_run_command(), but
+        the API round trips overlap instead of running back to back, so a
+        batch of N results costs roughly one request latency rather than
+        N. Callers invoke via asyncio.run(gen.explain_many(results)).
+
+        Args:
+            results: Run command detection results
+            project_name: Optional project name shared by all results
+
+        Returns:
+            Explanations aligned with the input list; failed or
+            unavailable entries are None, matching single-call semantics
+        """
+        if not self.is_available():
+            return [None] * len(results)
+
+        # Cap in-flight requests so a large batch does not trip the API
+        # rate limit that would fail the whole run
+        semaphore = asyncio.Semaphore(8)
+        agenerate = getattr(self.llm_client, "agenerate", None)
+
+        async def _explain_one(run_result: RunCommandResult) -> Optional[str]:
+            async with semaphore:
+                try:
+                    if not run_result.has_command():
+                        # The no-command path stays synchronous; run it in
+                        # a worker thread so it does not block the loop
+                        return await asyncio.to_thread(
+                            self._explain_no_command, run_result
+                        )
+
+                    prompt = self._build_prompt(run_result, project_name)
+                    if agenerate is not None:
+                        return await agenerate(prompt, max_tokens=200)
+                    # Clients without an async API fall back to their
+                    # blocking generate() on a worker thread
+                    return await asyncio.to_thread(
+                        self.llm_client.generate, prompt, max_tokens=200
+                    )
+                except LLMError:
+                    # Per-entry failure must not break the batch
+                    return None
+
+        return list(await asyncio.gather(*(_explain_one(r) for r in results)))
+
     def _build_prompt(
         self, 
         run_result: RunCommandResult,
@@ -84,31 +170,20 @@ class ExplanationGenerator:
         It must pass ONLY facts that were already determined.
         """
         project_context = f" for the '{project_name}' project" if project_name else ""
-        
-        # Extract evidence details
-        evidence_summary = []
-        for evidence in run_result.evidence:
-            evidence_summary.append(f"- {evidence.file_path}: {evidence.reason}")
-        
-        evidence_text = "\n".join(evidence_summary) if evidence_summary else "No additional evidence"
-        
-        prompt = f"""Explain this command{project_context} in 3-6 lines for a developer:
-
-Command: {run_result.command}
-
-Evidence:
-{evidence_text}
 
-Command type: {run_result.command_type.value}
+        # Feed the formatted lines straight into join's C path; no
+        # intermediate evidence_summary list
+        evidence_text = "\n".join(
+            f"- {evidence.file_path}: {evidence.reason}"
+            for evidence in run_result.evidence
+        ) or "No additional evidence"
 
-Provide a clear, technical explanation of:
-1. What this command does
-2. What the key flags/options mean (if any)
-3. When this command is typically used
-
-Do not add recommendations or speculate beyond what is shown above."""
-        
-        return prompt
+        return _PROMPT_TMPL.format(
+            project_context=project_context,
+            command=run_result.command,
+            evidence_text=evidence_text,
+            command_type=run_result.command_type.value,
+        )
     
     def _explain_no_command(self, run_result: RunCommandResult) -> Optional[str]:
         """
@@ -116,20 +191,8 @@ Do not add recommendations or speculate beyond what is shown above."""
         
         This is a fallback explanation when detection found nothing.
         """
-        prompt = """Explain in 3-4 lines why a Python project might not have a detectable run command, and what a developer should check:
-
-The automated detection looked for:
-- Poetry scripts in pyproject.toml
-- FastAPI applications (app = FastAPI())
-- Flask applications (app = Flask(__name__))
-- Python files with if __name__ == "__main__"
-
-None of these patterns were found.
-
-Keep the explanation practical and actionable."""
-        
         try:
-            explanation = self.llm_client.generate(prompt, max_tokens=150)
+            explanation = self.llm_client.generate(_NO_COMMAND_PROMPT, max_tokens=150)
             return explanation
         except LLMError:
             return None
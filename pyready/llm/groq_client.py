@@ -1,11 +1,45 @@
 """Groq LLM client implementation."""
 
+import hashlib
+import json
 import os
-from typing import Optional
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
 import httpx
 
 from .client import LLMClient, LLMError
 
+# Optional disk cache for generations: identical (model, prompt,
+# max_tokens) triples return the stored text instead of paying a
+# multi-second HTTPS round trip. Opt-in via PYREADY_LLM_CACHE=1 since
+# cached answers go stale if prompts encode changing context.
+_CACHE_DIR = Path.home() / ".cache" / "pyready" / "llm"
+_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+
+def _disk_cache_enabled() -> bool:
+    return os.getenv("PYREADY_LLM_CACHE") == "1"
+
+
+def _read_cached(cache_file: Path) -> Optional[str]:
+    """Return a cached generation if present and fresh, else None"""
+    try:
+        if time.time() - cache_file.stat().st_mtime < _CACHE_TTL_SECONDS:
+            return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    return None
+
+
+def _write_cached(cache_file: Path, text: str) -> None:
+    """Persist a generation to the cache (best-effort)"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(text, encoding="utf-8")
+    except OSError:
+        pass
+
 
 class GroqClient(LLMClient):
     """Groq LLM client using OpenAI-compatible API."""
@@ -21,7 +55,79 @@ class GroqClient(LLMClient):
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
         self.model = model
         self.base_url = "https://api.groq.com/openai/v1"
-        
+        # In-process memo: batch runs repeat (command, evidence)
+        # signatures across projects, and temperature is low enough
+        # that reusing a response is semantically sound
+        self._memo: Dict[str, str] = {}
+        # Created lazily; reused across calls so the TLS handshake and
+        # TCP connect are paid once, not per generation
+        self._client: Optional[httpx.Client] = None
+
+    _SYSTEM_PROMPT = (
+        "You are a technical assistant that explains development commands. "
+        "Provide clear, concise explanations in 3-6 lines. "
+        "Do not speculate or add information beyond what is provided. "
+        "Focus on what the command does, not recommendations."
+    )
+
+    def _cache_key(self, prompt: str, max_tokens: int) -> str:
+        return hashlib.blake2b(
+            f"{self.model}|{max_tokens}|{prompt}".encode(), digest_size=16
+        ).hexdigest()
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _request_json(self, prompt: str, max_tokens: int) -> dict:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self._SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.3,  # Low temperature for consistency
+        }
+
+    def _get_client(self) -> httpx.Client:
+        """Create the shared HTTP client on first use"""
+        if self._client is None:
+            headers = self._headers()
+            limits = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30)
+            try:
+                self._client = httpx.Client(
+                    base_url=self.base_url,
+                    timeout=8.0,
+                    http2=True,
+                    headers=headers,
+                    limits=limits,
+                )
+            except ImportError:
+                # http2 needs the optional h2 package; HTTP/1.1 with
+                # keep-alive still amortizes the handshake
+                self._client = httpx.Client(
+                    base_url=self.base_url,
+                    timeout=8.0,
+                    headers=headers,
+                    limits=limits,
+                )
+        return self._client
+
+    def close(self) -> None:
+        """Release the pooled HTTP connection, if any"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def is_available(self) -> bool:
         """Check if Groq API key is configured."""
         return self.api_key is not None and len(self.api_key) > 0
@@ -42,44 +148,44 @@ class GroqClient(LLMClient):
         """
         if not self.is_available():
             raise LLMError("Groq API key not configured. Set GROQ_API_KEY environment variable.")
-        
+
+        cache_key = self._cache_key(prompt, max_tokens)
+
+        cached = self._memo.get(cache_key)
+        if cached is not None:
+            return cached
+
+        cache_file = None
+        if _disk_cache_enabled():
+            cache_file = _CACHE_DIR / f"{cache_key}.txt"
+            cached = _read_cached(cache_file)
+            if cached is not None:
+                self._memo[cache_key] = cached
+                return cached
+
         try:
-            with httpx.Client(timeout=8.0) as client:
+            client = self._get_client()
+            text = self._generate_streaming(client, prompt, max_tokens)
+
+            if text is None:
+                # Server didn't stream anything usable; plain request
                 response = client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": (
-                                    "You are a technical assistant that explains development commands. "
-                                    "Provide clear, concise explanations in 3-6 lines. "
-                                    "Do not speculate or add information beyond what is provided. "
-                                    "Focus on what the command does, not recommendations."
-                                )
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        "max_tokens": max_tokens,
-                        "temperature": 0.3,  # Low temperature for consistency
-                    }
+                    "/chat/completions",
+                    json=self._request_json(prompt, max_tokens)
                 )
-                
+
                 response.raise_for_status()
                 data = response.json()
-                
+
                 if "choices" not in data or len(data["choices"]) == 0:
                     raise LLMError("No response from Groq API")
-                
-                return data["choices"][0]["message"]["content"].strip()
+
+                text = data["choices"][0]["message"]["content"].strip()
+
+            self._memo[cache_key] = text
+            if cache_file is not None:
+                _write_cached(cache_file, text)
+            return text
         
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
@@ -91,6 +197,131 @@ class GroqClient(LLMClient):
         
         except httpx.TimeoutException:
             raise LLMError("Groq API request timed out")
-        
+
+        except Exception as e:
+            raise LLMError(f"Unexpected error: {str(e)}")
+
+    # Streaming early-stop: once the reply already has this many
+    # non-empty lines, a blank line means the model finished its short
+    # explanation and the remaining tokens can be dropped on the floor
+    _STREAM_STOP_MIN_LINES = 3
+
+    def _generate_streaming(self, client: httpx.Client, prompt: str, max_tokens: int) -> Optional[str]:
+        """
+        Stream a completion, cutting the connection at a natural stop.
+
+        Tokens arrive as SSE deltas, so the first usable text lands after
+        time-to-first-byte instead of after the full generation; closing
+        the stream early also saves the per-token tail on the wire.
+
+        Returns:
+            Accumulated text, or None when the server produced no
+            streamed content (caller falls back to a plain request)
+        """
+        payload = self._request_json(prompt, max_tokens)
+        payload["stream"] = True
+
+        parts: List[str] = []
+
+        with client.stream("POST", "/chat/completions", json=payload) as response:
+            response.raise_for_status()
+
+            for line in response.iter_lines():
+                if not line.startswith("data: "):
+                    continue
+
+                chunk = line[6:]
+                if chunk == "[DONE]":
+                    break
+
+                try:
+                    delta = json.loads(chunk)["choices"][0].get("delta", {})
+                except (ValueError, LookupError):
+                    continue
+
+                piece = delta.get("content")
+                if not piece:
+                    continue
+                parts.append(piece)
+
+                # Only re-examine the accumulated text on newlines; a
+                # blank line after enough content is the stop signal
+                if "\n" in piece:
+                    so_far = "".join(parts)
+                    if so_far.endswith("\n\n"):
+                        lines = [l for l in so_far.splitlines() if l.strip()]
+                        if len(lines) >= self._STREAM_STOP_MIN_LINES:
+                            break
+
+        if not parts:
+            return None
+        return "".join(parts).strip()
+
+    async def agenerate(self, prompt: str, max_tokens: int = 200) -> str:
+        """
+        Generate text using the Groq API without blocking the event loop.
+
+        Shares the memo and disk cache with generate(), so a batch of
+        concurrent calls still pays for each distinct prompt only once.
+
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text
+
+        Raises:
+            LLMError: If API call fails
+        """
+        if not self.is_available():
+            raise LLMError("Groq API key not configured. Set GROQ_API_KEY environment variable.")
+
+        cache_key = self._cache_key(prompt, max_tokens)
+
+        cached = self._memo.get(cache_key)
+        if cached is not None:
+            return cached
+
+        cache_file = None
+        if _disk_cache_enabled():
+            cache_file = _CACHE_DIR / f"{cache_key}.txt"
+            cached = _read_cached(cache_file)
+            if cached is not None:
+                self._memo[cache_key] = cached
+                return cached
+
+        try:
+            async with httpx.AsyncClient(
+                base_url=self.base_url, timeout=8.0, headers=self._headers()
+            ) as client:
+                response = await client.post(
+                    "/chat/completions",
+                    json=self._request_json(prompt, max_tokens)
+                )
+
+                response.raise_for_status()
+                data = response.json()
+
+                if "choices" not in data or len(data["choices"]) == 0:
+                    raise LLMError("No response from Groq API")
+
+                text = data["choices"][0]["message"]["content"].strip()
+                self._memo[cache_key] = text
+                if cache_file is not None:
+                    _write_cached(cache_file, text)
+                return text
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise LLMError("Invalid Groq API key")
+            elif e.response.status_code == 429:
+                raise LLMError("Groq API rate limit exceeded")
+            else:
+                raise LLMError(f"Groq API error: {e.response.status_code}")
+
+        except httpx.TimeoutException:
+            raise LLMError("Groq API request timed out")
+
         except Exception as e:
             raise LLMError(f"Unexpected error: {str(e)}")
@@ -2,15 +2,21 @@
 
 from pyready.policy.engine import evaluate_policy, load_policy
 from pyready.policy.explain import (
+    evaluate_and_explain,
     explain_policy,
+    export_both,
     export_explanation_json,
-    export_explanation_markdown
+    export_explanation_markdown,
+    export_explanations_batch
 )
 
 __all__ = [
     'evaluate_policy',
+    'evaluate_and_explain',
     'load_policy',
     'explain_policy',
+    'export_both',
     'export_explanation_json',
-    'export_explanation_markdown'
+    'export_explanation_markdown',
+    'export_explanations_batch'
 ]
@@ -13,12 +13,48 @@ This separation is critical:
 - Run command explanations (cli/explain.py) = Optional Groq enhancement
 """
 
-from typing import List, Dict, Set
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Dict, Set, Tuple
+
+# orjson serializes nested dicts several times faster than stdlib json
+# and emits UTF-8 bytes directly; optional, like everywhere else in the CLI
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from pyready.schemas.diff_schema import OnboardAIDiffReport, DiffItem
 from pyready.schemas.policy_schema import PolicyDefinition, PolicyRule, PolicyEvaluationResult
 from pyready.schemas.policy_explain_schema import RuleEvaluationTrace, PolicyExplanation
-from pyready.policy.engine import _rule_matches
+from pyready.policy.engine import _evaluate_with_matches, _rule_matches
+
+
+def evaluate_and_explain(
+    diff: OnboardAIDiffReport,
+    policy: PolicyDefinition
+) -> Tuple[PolicyEvaluationResult, PolicyExplanation]:
+    """
+    Evaluate a policy and explain it in one fused pass.
+
+    The per-rule match lists fall out of the same (changes x rules)
+    loop that produces the violations, so callers that want both the
+    result and its explanation (e.g. `pyready diff --explain-policy`)
+    pay for one traversal instead of evaluating and then rescanning
+    the violations. Carries the same determinism guarantee as
+    explain_policy.
+
+    Args:
+        diff: Diff report to evaluate
+        policy: Policy definition to apply
+
+    Returns:
+        (evaluation result, explanation with traces for all rules)
+    """
+    evaluation, violations_by_rule = _evaluate_with_matches(diff, policy)
+    explanation = _build_explanation(diff, policy, evaluation.status, violations_by_rule)
+    return evaluation, explanation
 
 
 def explain_policy(
@@ -28,43 +64,67 @@ def explain_policy(
 ) -> PolicyExplanation:
     """
     Generate explanation for policy evaluation.
-    
+
     Traces every rule to explain why the overall status was reached.
     Does NOT re-evaluate - uses existing evaluation result.
-    
+
     DETERMINISM GUARANTEE:
     - Same diff + same policy + same evaluation = same explanation (always)
     - No network calls, no API dependencies, no variation
     - Suitable for audit logs, regression testing, CI/CD output caching
-    
+
     Args:
         diff: Diff report that was evaluated
         policy: Policy definition that was applied
         evaluation: Result of policy evaluation
-    
+
+    Returns:
+        PolicyExplanation with traces for all rules
+    """
+
+    # Build the rule_id -> matched keys lookup from the existing result
+    violations_by_rule: Dict[str, List[str]] = {}
+    for violation in evaluation.violations:
+        violations_by_rule.setdefault(violation.rule_id, []).append(violation.diff_item.key)
+
+    return _build_explanation(diff, policy, evaluation.status, violations_by_rule)
+
+
+def _build_explanation(
+    diff: OnboardAIDiffReport,
+    policy: PolicyDefinition,
+    overall_status: str,
+    violations_by_rule: Dict[str, List[str]]
+) -> PolicyExplanation:
+    """
+    Trace every rule in policy file order and assemble the explanation.
+
+    Shared by explain_policy and the fused evaluate_and_explain path.
+
+    Args:
+        diff: Diff report that was evaluated
+        policy: Policy definition that was applied
+        overall_status: Status from the evaluation
+        violations_by_rule: Lookup of rule_id -> matched change keys
+
     Returns:
         PolicyExplanation with traces for all rules
     """
-    
-    # Build violation lookup for quick access
-    violations_by_rule = _build_violation_lookup(evaluation)
-    
-    # Trace each rule in policy file order
     traces = []
     rules_evaluated = 0
     rules_matched = 0
-    
+
     for rule in policy.rules:
         trace = _trace_rule(rule, diff, violations_by_rule)
         traces.append(trace)
-        
+
         if trace.evaluated:
             rules_evaluated += 1
         if trace.matched:
             rules_matched += 1
-    
+
     return PolicyExplanation(
-        overall_status=evaluation.status,
+        overall_status=overall_status,
         total_rules=len(policy.rules),
         rules_evaluated=rules_evaluated,
         rules_matched=rules_matched,
@@ -72,26 +132,6 @@ def explain_policy(
     )
 
 
-def _build_violation_lookup(evaluation: PolicyEvaluationResult) -> Dict[str, List[str]]:
-    """
-    Build lookup map of rule_id → list of matched diff item keys.
-    
-    Args:
-        evaluation: Policy evaluation result
-    
-    Returns:
-        Dictionary mapping rule IDs to matched change keys
-    """
-    lookup = {}
-    
-    for violation in evaluation.violations:
-        if violation.rule_id not in lookup:
-            lookup[violation.rule_id] = []
-        lookup[violation.rule_id].append(violation.diff_item.key)
-    
-    return lookup
-
-
 def _trace_rule(
     rule: PolicyRule,
     diff: OnboardAIDiffReport,
@@ -284,77 +324,151 @@ def _explain_no_match(
 def export_explanation_json(explanation: PolicyExplanation, output_path) -> None:
     """
     Export policy explanation as JSON.
-    
+
     Args:
         explanation: Policy explanation to export
         output_path: Path to write JSON file
     """
-    import json
-    
     # Serialize with proper handling
     explanation_dict = explanation.model_dump(mode='json')
-    
-    # Write with stable key ordering
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(explanation_dict, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+    # Serialize to UTF-8 bytes directly and write in binary mode —
+    # orjson when available, skipping the text-mode encoder either way.
+    # Key ordering and indentation stay stable across both paths.
+    if orjson is not None:
+        payload = orjson.dumps(
+            explanation_dict,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+        )
+    else:
+        import json
+        payload = json.dumps(
+            explanation_dict, indent=2, sort_keys=True, ensure_ascii=False
+        ).encode('utf-8')
+
+    with open(output_path, 'wb') as f:
+        f.write(payload)
+
+
+async def export_both(explanation: PolicyExplanation, json_path, md_path) -> None:
+    """
+    Export the JSON and Markdown forms of an explanation concurrently.
+
+    Each export runs on a worker thread via asyncio.to_thread, so the
+    serialization and the two file writes overlap instead of running
+    back to back. Callers invoke via
+    asyncio.run(export_both(explanation, json_path, md_path)).
+
+    Args:
+        explanation: Policy explanation to export
+        json_path: Path to write the JSON file
+        md_path: Path to write the Markdown file
+    """
+    await asyncio.gather(
+        asyncio.to_thread(export_explanation_json, explanation, json_path),
+        asyncio.to_thread(export_explanation_markdown, explanation, md_path),
+    )
+
+
+def export_explanations_batch(
+    named_explanations: Iterable[Tuple[str, PolicyExplanation]],
+    output_dir,
+) -> None:
+    """
+    Export many explanations' JSON and Markdown files in one batch.
+
+    Pipelines that dump one explanation per project or rule set pay the
+    per-file open/write/close round trip N times in sequence; here every
+    write is submitted to a small thread pool so the kernel overlaps
+    them. File I/O releases the GIL, so the pool parallelizes for real.
+
+    Args:
+        named_explanations: (file stem, explanation) pairs; each pair
+            produces <stem>.json and <stem>.md in output_dir
+        output_dir: Directory to write into (created if missing)
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks = []
+    for stem, explanation in named_explanations:
+        tasks.append((export_explanation_json, explanation, output_dir / f"{stem}.json"))
+        tasks.append((export_explanation_markdown, explanation, output_dir / f"{stem}.md"))
+
+    if not tasks:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as pool:
+        futures = [pool.submit(export, explanation, path) for export, explanation, path in tasks]
+        for future in futures:
+            future.result()
 
 
 def export_explanation_markdown(explanation: PolicyExplanation, output_path) -> None:
     """
     Export policy explanation as Markdown.
-    
+
     Args:
         explanation: Policy explanation to export
         output_path: Path to write Markdown file
     """
-    lines = []
-    
+    # Stream the document into the file buffer as it is generated:
+    # no intermediate lines list and no full-document join allocation
+    with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.writelines(_iter_markdown(explanation))
+
+
+# Status lines keyed on (evaluated, matched, action): one dict lookup
+# per rule instead of re-running the branch chain and rebuilding the
+# f-string; unknown actions fall through to the formatted variant
+_STATUS = {
+    (False, False, None): "**Status:** ⏭ SKIPPED (disabled)\n",
+    (True, True, "FAIL"): "**Status:** ❌ MATCHED (FAIL)\n",
+    (True, True, "WARN"): "**Status:** ⚠️ MATCHED (WARN)\n",
+    (True, False, None): "**Status:** ✓ NOT MATCHED\n",
+}
+
+
+def _iter_markdown(explanation: PolicyExplanation):
+    """Yield the explanation's Markdown as chunks, newlines included.
+
+    Chunks are held back one step so the final one can shed its trailing
+    newline: the document must end in a single newline, exactly as the
+    old '\\n'.join(lines) build produced.
+    """
     # Header
-    lines.append("# Policy Explanation")
-    lines.append("")
-    lines.append(f"**Overall Status:** {explanation.overall_status}")
-    lines.append(f"**Total Rules:** {explanation.total_rules}")
-    lines.append(f"**Rules Evaluated:** {explanation.rules_evaluated}")
-    lines.append(f"**Rules Matched:** {explanation.rules_matched}")
-    lines.append("")
-    
-    # Rule traces
-    lines.append("## Rule Evaluation Traces")
-    lines.append("")
-    
+    pending = (
+        "# Policy Explanation\n\n"
+        f"**Overall Status:** {explanation.overall_status}\n"
+        f"**Total Rules:** {explanation.total_rules}\n"
+        f"**Rules Evaluated:** {explanation.rules_evaluated}\n"
+        f"**Rules Matched:** {explanation.rules_matched}\n\n"
+        "## Rule Evaluation Traces\n\n"
+    )
+
+    # Rule traces: each rule becomes one joined chunk
     for trace in explanation.rules:
-        # Rule header
-        lines.append(f"### {trace.rule_id}")
-        lines.append("")
-        lines.append(f"**Description:** {trace.description}")
-        lines.append("")
-        
-        # Status
-        if not trace.evaluated:
-            lines.append("**Status:** ⏭ SKIPPED (disabled)")
-        elif trace.matched:
-            action_symbol = "❌" if trace.action == "FAIL" else "⚠️"
-            lines.append(f"**Status:** {action_symbol} MATCHED ({trace.action})")
-        else:
-            lines.append("**Status:** ✓ NOT MATCHED")
-        lines.append("")
-        
-        # Reason
-        lines.append("**Reason:**")
-        lines.append("")
+        yield pending
+        status_key = (trace.evaluated, trace.matched, trace.action if trace.matched else None)
+        status_line = _STATUS.get(status_key) or f"**Status:** ⚠️ MATCHED ({trace.action})\n"
+
+        parts = [
+            f"### {trace.rule_id}\n\n",
+            f"**Description:** {trace.description}\n\n",
+            status_line,
+            "\n**Reason:**\n\n",
+        ]
+
         # Indent reason text
-        for reason_line in trace.reason.split('\n'):
-            lines.append(f"  {reason_line}")
-        lines.append("")
-        
+        parts.extend(f"  {reason_line}\n" for reason_line in trace.reason.split('\n'))
+        parts.append("\n")
+
         # Matched changes (if any)
         if trace.matched_changes:
-            lines.append("**Matched Changes:**")
-            lines.append("")
-            for change in trace.matched_changes:
-                lines.append(f"- `{change}`")
-            lines.append("")
-    
-    # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+            parts.append("**Matched Changes:**\n\n")
+            parts.extend(f"- `{change}`\n" for change in trace.matched_changes)
+            parts.append("\n")
+
+        pending = ''.join(parts)
+
+    yield pending[:-1]
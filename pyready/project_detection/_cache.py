@@ -0,0 +1,46 @@
+"""Cached pyproject.toml parsing shared across project detection.
+
+Capability detection and evidence collection all want the same parsed
+pyproject.toml; caching on (path, mtime) means one open and one TOML
+parse per file per process, however many detectors consult it.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+if sys.version_info >= (3, 11):
+    import tomllib as tomli
+else:
+    import tomli
+
+
+@lru_cache(maxsize=64)
+def _load_pyproject_cached(path_str: str, mtime_ns: int) -> dict:
+    with open(path_str, "rb") as f:
+        return tomli.load(f)
+
+
+def load_pyproject(path) -> dict:
+    """
+    Parse a pyproject.toml with memoization keyed on (path, mtime).
+
+    Missing or unparseable files yield {} — detection treats absent
+    evidence as False, never as an error. The returned dict is shared;
+    callers must treat it as read-only.
+
+    Args:
+        path: Path to the pyproject.toml
+
+    Returns:
+        Parsed document, or {} when unreadable
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {}
+
+    try:
+        return _load_pyproject_cached(os.fspath(path), st.st_mtime_ns)
+    except Exception:
+        return {}
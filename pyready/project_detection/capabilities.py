@@ -1,11 +1,88 @@
 """Project capability detection - filesystem evidence only"""
 
+import hashlib
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Set
-import tomli
 
+from pyready.project_detection._cache import load_pyproject
 from pyready.schemas.capability_schema import ProjectCapabilities, CapabilityCheckResult
 
+# Marker files whose mtimes, together with the root directory's, form
+# the detection signature: touching any of them (or adding/removing a
+# root entry) invalidates the cached result
+_SIG_FILES = (
+    'pyproject.toml',
+    'requirements.txt',
+    'Pipfile',
+    'setup.py',
+    'setup.cfg',
+    'poetry.lock',
+    'Pipfile.lock',
+)
+
+# detect() output per (root, signature): the same project is re-analyzed
+# several times in one process (intent classification, QA), and a repeat
+# costs a handful of stats plus a dict hit instead of the full probe set
+_DETECT_CACHE: Dict[tuple, CapabilityCheckResult] = {}
+
+# Optional on-disk tier of the same cache, for CI jobs that re-run the
+# CLI on unchanged repos across processes. Opt-in via
+# PYREADY_CAPABILITY_CACHE=1, mirroring the LLM disk cache.
+_DISK_CACHE_DIR = Path.home() / ".cache" / "pyready" / "capabilities"
+_DISK_CACHE_TTL_SECONDS = 24 * 3600
+
+
+def _disk_cache_enabled() -> bool:
+    return os.getenv("PYREADY_CAPABILITY_CACHE") == "1"
+
+
+def _disk_cache_file(signature: tuple) -> Path:
+    digest = hashlib.blake2b(repr(signature).encode(), digest_size=16).hexdigest()
+    return _DISK_CACHE_DIR / f"{digest}.json"
+
+
+def _read_disk_cached(cache_file: Path):
+    """Return a cached result if present and fresh, else None"""
+    try:
+        if time.time() - cache_file.stat().st_mtime < _DISK_CACHE_TTL_SECONDS:
+            return CapabilityCheckResult.model_validate_json(
+                cache_file.read_text(encoding="utf-8")
+            )
+    except Exception:
+        pass
+    return None
+
+
+def _write_disk_cached(cache_file: Path, result: CapabilityCheckResult) -> None:
+    """Persist a detection result to the cache (best-effort)"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(result.model_dump_json(), encoding="utf-8")
+    except OSError:
+        pass
+
+
+# Directories the python-file walk never descends into; module-level
+# frozenset so the probe doesn't rebuild the set on every call
+_EXCLUDE_DIRS = frozenset({'__pycache__', '.venv', 'venv', 'env', '.git', 'node_modules'})
+
+# Pinned requirement line: a package name followed by ==, anchored at
+# line start so '==' inside comments or URL fragments doesn't count
+_PIN_RE = re.compile(rb'(?m)^\s*[A-Za-z0-9_.\-]+\s*==')
+
+
+def _safe_mtime_ns(path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
 
 class CapabilityDetector:
     """
@@ -19,7 +96,15 @@ class CapabilityDetector:
     
     def __init__(self, project_path: Path):
         self.project_path = project_path.resolve()
-        
+        # Plain-string root: the probes below build paths with
+        # os.path.join, skipping a PurePath allocation per candidate
+        self._root = str(self.project_path)
+
+    @cached_property
+    def _pyproject(self) -> dict:
+        """Parsed pyproject.toml, read once; {} when absent or invalid"""
+        return load_pyproject(self.project_path / 'pyproject.toml')
+
     def detect(self) -> CapabilityCheckResult:
         """
         Detect all capabilities for the project.
@@ -27,24 +112,49 @@ class CapabilityDetector:
         Returns:
             CapabilityCheckResult with boolean flags and evidence
         """
+        root = str(self.project_path)
+        signature = (root, _safe_mtime_ns(root)) + tuple(
+            _safe_mtime_ns(os.path.join(root, name)) for name in _SIG_FILES
+        )
+
+        cached = _DETECT_CACHE.get(signature)
+        if cached is not None:
+            return cached
+
+        cache_file = None
+        if _disk_cache_enabled():
+            cache_file = _disk_cache_file(signature)
+            cached = _read_disk_cached(cache_file)
+            if cached is not None:
+                _DETECT_CACHE[signature] = cached
+                return cached
+
         evidence: Dict[str, List[str]] = {}
         warnings: List[str] = []
-        
-        # Capability 1: Python files
-        has_python = self._detect_python_files(evidence)
-        
-        # Capability 2: Dependency declaration
-        has_deps = self._detect_dependency_declaration(evidence)
-        
-        # Capability 3: Isolated environment
-        has_venv = self._detect_isolated_environment(evidence)
-        
-        # Capability 4: Reproducible environment
-        has_repro = self._detect_reproducible_environment(evidence)
-        
-        # Capability 5: Detectable entry point
-        has_entry = self._detect_entrypoint(evidence)
-        
+
+        # The five probes are independent and block on filesystem
+        # syscalls, which release the GIL — running them on a small pool
+        # makes cold-cache wall time ~max(probe) instead of sum(probes).
+        # Each probe writes into its own evidence dict so no lock is
+        # needed; results are merged in the fixed order below.
+        probes = (
+            self._detect_python_files,      # Capability 1: Python files
+            self._detect_dependency_declaration,  # Capability 2: Dependency declaration
+            self._detect_isolated_environment,    # Capability 3: Isolated environment
+            self._detect_reproducible_environment,  # Capability 4: Reproducible environment
+            self._detect_entrypoint,        # Capability 5: Detectable entry point
+        )
+        probe_evidence: List[Dict[str, List[str]]] = [{} for _ in probes]
+
+        with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+            futures = [pool.submit(probe, ev) for probe, ev in zip(probes, probe_evidence)]
+            has_python, has_deps, has_venv, has_repro, has_entry = [
+                future.result() for future in futures
+            ]
+
+        for part in probe_evidence:
+            evidence.update(part)
+
         capabilities = ProjectCapabilities(
             has_python_files=has_python,
             has_dependency_declaration=has_deps,
@@ -54,11 +164,15 @@ class CapabilityDetector:
             evidence=evidence
         )
         
-        return CapabilityCheckResult(
-            project_path=str(self.project_path),
+        result = CapabilityCheckResult(
+            project_path=root,
             capabilities=capabilities,
             warnings=warnings
         )
+        _DETECT_CACHE[signature] = result
+        if cache_file is not None:
+            _write_disk_cached(cache_file, result)
+        return result
     
     def _detect_python_files(self, evidence: Dict[str, List[str]]) -> bool:
         """
@@ -67,24 +181,33 @@ class CapabilityDetector:
         Evidence:
         - Any .py file (excluding __pycache__, .venv, venv, env)
         """
-        exclude_dirs = {'__pycache__', '.venv', 'venv', 'env', '.git', 'node_modules'}
+        exclude_dirs = _EXCLUDE_DIRS
         found_files: List[str] = []
-        
-        try:
-            for py_file in self.project_path.rglob('*.py'):
-                # Skip excluded directories
-                if any(excluded in py_file.parts for excluded in exclude_dirs):
-                    continue
-                
-                relative_path = py_file.relative_to(self.project_path)
-                found_files.append(str(relative_path))
-                
-                # Limit evidence to first 5 files
-                if len(found_files) >= 5:
-                    break
-        except Exception:
-            pass
-        
+
+        # Breadth-first scandir walk that prunes excluded directories
+        # before descending and stops at 5 hits; rglob would stat and
+        # wrap every entry in the tree just to filter afterwards
+        root = str(self.project_path)
+        queue = deque([root])
+
+        while queue and len(found_files) < 5:
+            try:
+                entries = os.scandir(queue.popleft())
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs:
+                            queue.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        found_files.append(os.path.relpath(entry.path, root))
+
+                        # Limit evidence to first 5 files
+                        if len(found_files) >= 5:
+                            break
+
         if found_files:
             evidence['has_python_files'] = found_files
             return True
@@ -104,43 +227,36 @@ class CapabilityDetector:
         found_files: List[str] = []
         
         # Check requirements.txt
-        req_file = self.project_path / 'requirements.txt'
-        if req_file.exists() and req_file.is_file():
+        if os.path.isfile(os.path.join(self._root, 'requirements.txt')):
             found_files.append('requirements.txt')
         
-        # Check pyproject.toml
-        pyproject = self.project_path / 'pyproject.toml'
-        if pyproject.exists() and pyproject.is_file():
-            try:
-                with open(pyproject, 'rb') as f:
-                    data = tomli.load(f)
-                
-                # Poetry format
-                if 'tool' in data and 'poetry' in data['tool']:
-                    if 'dependencies' in data['tool']['poetry']:
-                        found_files.append('pyproject.toml: [tool.poetry.dependencies]')
-                
-                # PEP 621 format
-                if 'project' in data:
-                    if 'dependencies' in data['project']:
-                        found_files.append('pyproject.toml: [project.dependencies]')
-            except Exception:
-                pass
-        
-        # Check setup.py
-        setup_file = self.project_path / 'setup.py'
-        if setup_file.exists() and setup_file.is_file():
-            try:
-                with open(setup_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if 'install_requires' in content:
-                        found_files.append('setup.py: install_requires')
-            except Exception:
-                pass
+        # Check pyproject.toml (parsed once, shared across detectors).
+        # Guard each table's shape: a valid TOML file can define these
+        # keys as scalars, and detection must not raise on odd layouts
+        data = self._pyproject
+        if data:
+            # Poetry format
+            tool = data.get('tool')
+            poetry = tool.get('poetry') if isinstance(tool, dict) else None
+            if isinstance(poetry, dict) and 'dependencies' in poetry:
+                found_files.append('pyproject.toml: [tool.poetry.dependencies]')
+
+            # PEP 621 format
+            project = data.get('project')
+            if isinstance(project, dict) and 'dependencies' in project:
+                found_files.append('pyproject.toml: [project.dependencies]')
         
+        # Check setup.py: the bytes-level substring scan needs no UTF-8
+        # decode, and one read call replaces the exists/is_file stats
+        try:
+            with open(os.path.join(self._root, 'setup.py'), 'rb') as f:
+                if b'install_requires' in f.read():
+                    found_files.append('setup.py: install_requires')
+        except OSError:
+            pass
+
         # Check Pipfile
-        pipfile = self.project_path / 'Pipfile'
-        if pipfile.exists() and pipfile.is_file():
+        if os.path.isfile(os.path.join(self._root, 'Pipfile')):
             found_files.append('Pipfile')
         
         if found_files:
@@ -161,18 +277,18 @@ class CapabilityDetector:
         found_dirs: List[str] = []
         
         venv_candidates = ['.venv', 'venv', 'env']
-        
+
         for candidate in venv_candidates:
-            venv_path = self.project_path / candidate
-            if not venv_path.exists() or not venv_path.is_dir():
-                continue
-            
-            # Check for Python executable (proof it's a real venv)
+            venv_dir = os.path.join(self._root, candidate)
+
+            # Check for Python executable (proof it's a real venv);
+            # probing the executable directly also answers whether the
+            # candidate directory exists, so no separate exists/is_dir
             has_python = (
-                (venv_path / 'Scripts' / 'python.exe').exists() or
-                (venv_path / 'bin' / 'python').exists()
+                os.path.isfile(os.path.join(venv_dir, 'bin', 'python')) or
+                os.path.isfile(os.path.join(venv_dir, 'Scripts', 'python.exe'))
             )
-            
+
             if has_python:
                 found_dirs.append(f'{candidate}/')
         
@@ -200,21 +316,17 @@ class CapabilityDetector:
         }
         
         for filename, display in lock_files.items():
-            lock_file = self.project_path / filename
-            if lock_file.exists() and lock_file.is_file():
+            if os.path.isfile(os.path.join(self._root, filename)):
                 found_files.append(display)
-        
-        # Check for pinned requirements.txt
-        req_file = self.project_path / 'requirements.txt'
-        if req_file.exists() and req_file.is_file():
-            try:
-                with open(req_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Look for pinned versions (==)
-                    if '==' in content:
-                        found_files.append('requirements.txt: pinned versions')
-            except Exception:
-                pass
+
+        # Check for pinned requirements.txt: the anchored bytes regex
+        # scans without decoding and ignores '==' in comments or URLs
+        try:
+            with open(os.path.join(self._root, 'requirements.txt'), 'rb') as f:
+                if _PIN_RE.search(f.read()):
+                    found_files.append('requirements.txt: pinned versions')
+        except OSError:
+            pass
         
         if found_files:
             evidence['has_reproducible_environment'] = found_files
@@ -237,46 +349,40 @@ class CapabilityDetector:
         """
         found_entries: List[str] = []
         
-        # Check pyproject.toml scripts
-        pyproject = self.project_path / 'pyproject.toml'
-        if pyproject.exists() and pyproject.is_file():
+        # Check pyproject.toml scripts (same shared parse as above, with
+        # the same shape guards against scalar-valued tables)
+        data = self._pyproject
+        if data:
+            # Poetry scripts
+            tool = data.get('tool')
+            poetry = tool.get('poetry') if isinstance(tool, dict) else None
+            scripts = poetry.get('scripts') if isinstance(poetry, dict) else None
+            if isinstance(scripts, dict) and scripts:
+                found_entries.append(f'pyproject.toml: [tool.poetry.scripts] ({len(scripts)} defined)')
+
+            # PEP 621 scripts
+            project = data.get('project')
+            scripts = project.get('scripts') if isinstance(project, dict) else None
+            if isinstance(scripts, dict) and scripts:
+                found_entries.append(f'pyproject.toml: [project.scripts] ({len(scripts)} defined)')
+        
+        # Check common entry point file names in the root and the usual
+        # subdirectories: one listing per directory answers all four
+        # name probes, so 12 stat calls collapse into at most 3 getdents
+        entry_files = ('main.py', 'run.py', 'app.py', '__main__.py')
+
+        for subdir in ('', 'app', 'src'):
+            dir_path = os.path.join(self._root, subdir) if subdir else self._root
             try:
-                with open(pyproject, 'rb') as f:
-                    data = tomli.load(f)
-                
-                # Poetry scripts
-                if 'tool' in data and 'poetry' in data['tool']:
-                    if 'scripts' in data['tool']['poetry']:
-                        scripts = data['tool']['poetry']['scripts']
-                        if scripts:
-                            script_names = list(scripts.keys())
-                            found_entries.append(f'pyproject.toml: [tool.poetry.scripts] ({len(script_names)} defined)')
-                
-                # PEP 621 scripts
-                if 'project' in data:
-                    if 'scripts' in data['project']:
-                        scripts = data['project']['scripts']
-                        if scripts:
-                            script_names = list(scripts.keys())
-                            found_entries.append(f'pyproject.toml: [project.scripts] ({len(script_names)} defined)')
-            except Exception:
-                pass
-        
-        # Check common entry point file names
-        entry_files = ['main.py', 'run.py', 'app.py', '__main__.py']
-        
-        for filename in entry_files:
-            entry_file = self.project_path / filename
-            if entry_file.exists() and entry_file.is_file():
-                found_entries.append(filename)
-        
-        # Check common subdirectory patterns
-        subdirs = ['app', 'src']
-        for subdir in subdirs:
+                with os.scandir(dir_path) as it:
+                    names = {e.name for e in it if e.is_file()}
+            except OSError:
+                continue
+
+            prefix = f'{subdir}/' if subdir else ''
             for filename in entry_files:
-                entry_file = self.project_path / subdir / filename
-                if entry_file.exists() and entry_file.is_file():
-                    found_entries.append(f'{subdir}/{filename}')
+                if filename in names:
+                    found_entries.append(prefix + filename)
         
         if found_entries:
             evidence['has_detectable_entrypoint'] = found_entries
@@ -1,6 +1,9 @@
 # onboardai/project_detection/detector.py
 """Core project type detection logic."""
 
+import os
+import stat as stat_module
+from functools import lru_cache
 from pathlib import Path
 
 from .evidence import (
@@ -13,35 +16,53 @@ from .models import ProjectType
 
 def detect_project_type(project_root: Path) -> ProjectType:
     """Detect project type based on filesystem evidence.
-    
+
     Detection follows strict priority order (first match wins):
     1. POETRY - pyproject.toml with [tool.poetry]
     2. PIP_VENV - requirements.txt or requirements/*.txt
     3. SETUPTOOLS - setup.py or setup.cfg
     4. UNKNOWN - none of the above
-    
+
     This function is deterministic and has no side effects.
-    
+
+    Repeated calls on the same unchanged root (multi-phase pipelines,
+    tests) are served from an mtime-keyed cache for the cost of one
+    stat instead of re-running every evidence probe.
+
     Args:
         project_root: Path to the project root directory
-        
+
     Returns:
         ProjectType enum value representing the detected project type
     """
-    if not project_root.exists() or not project_root.is_dir():
+    # One stat answers existence, is-a-directory, and the cache key
+    try:
+        st = project_root.stat()
+    except OSError:
+        return ProjectType.UNKNOWN
+
+    if not stat_module.S_ISDIR(st.st_mode):
         return ProjectType.UNKNOWN
-    
+
+    return _detect_cached(os.path.realpath(project_root), st.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _detect_cached(root_str: str, mtime_ns: int) -> ProjectType:
+    """Evidence probes behind the (root, mtime) memo"""
+    project_root = Path(root_str)
+
     # Priority 1: Poetry
     if has_poetry_pyproject(project_root):
         return ProjectType.POETRY
-    
+
     # Priority 2: Pip + venv
     if has_requirements_files(project_root):
         return ProjectType.PIP_VENV
-    
+
     # Priority 3: Setuptools
     if has_setuptools_files(project_root):
         return ProjectType.SETUPTOOLS
-    
+
     # Fallback: Unknown
     return ProjectType.UNKNOWN
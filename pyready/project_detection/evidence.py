@@ -4,29 +4,57 @@
 All functions are deterministic and based on filesystem checks only.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import FrozenSet
+
+from pyready.project_detection._cache import load_pyproject
+
+
+@lru_cache(maxsize=64)
+def _root_listing_cached(root_str: str, mtime_ns: int) -> FrozenSet[str]:
+    try:
+        with os.scandir(root_str) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+
+def _root_listing(root) -> FrozenSet[str]:
+    """
+    Top-level entry names of a directory, memoized on (path, mtime).
+
+    One getdents call answers every marker-file presence question the
+    evidence functions ask, instead of a stat syscall per candidate;
+    sibling checks within a run share the listing through the cache.
+    """
+    try:
+        st = os.stat(root)
+    except OSError:
+        return frozenset()
+
+    return _root_listing_cached(os.fspath(root), st.st_mtime_ns)
 
 
 def has_poetry_pyproject(root: Path) -> bool:
     """Check if project has Poetry configuration.
-    
-    Evidence: pyproject.toml exists AND contains [tool.poetry] section.
-    
+
+    Evidence: pyproject.toml exists AND contains a [tool.poetry] table.
+
     Args:
         root: Project root directory
-        
+
     Returns:
         True if Poetry project detected, False otherwise
     """
-    pyproject = root / "pyproject.toml"
-    if not pyproject.exists():
-        return False
-    
-    try:
-        content = pyproject.read_text(encoding="utf-8")
-        return "[tool.poetry]" in content
-    except (OSError, UnicodeDecodeError):
-        return False
+    # Structural check against the shared cached parse: no re-read, and
+    # unlike the old substring scan it also recognizes files that only
+    # spell out subtables like [tool.poetry.dependencies]. A valid TOML
+    # file may still define "tool" as a scalar, so guard the shape —
+    # evidence collection reports absent evidence as False, never raises
+    tool = load_pyproject(root / "pyproject.toml").get("tool")
+    return isinstance(tool, dict) and "poetry" in tool
 
 
 def has_requirements_files(root: Path) -> bool:
@@ -44,19 +72,23 @@ def has_requirements_files(root: Path) -> bool:
         True if requirements files found, False otherwise
     """
     # Check root-level requirements files
-    if (root / "requirements.txt").exists():
-        return True
-    
-    if (root / "requirements-dev.txt").exists():
+    names = _root_listing(root)
+
+    if "requirements.txt" in names or "requirements-dev.txt" in names:
         return True
-    
-    # Check requirements/ directory
-    requirements_dir = root / "requirements"
-    if requirements_dir.is_dir():
-        txt_files = list(requirements_dir.glob("*.txt"))
-        if txt_files:
-            return True
-    
+
+    # Check requirements/ directory, short-circuiting on the first .txt
+    # rather than materializing the whole glob
+    if "requirements" in names:
+        try:
+            with os.scandir(root / "requirements") as it:
+                for entry in it:
+                    if entry.name.endswith(".txt") and entry.is_file():
+                        return True
+        except OSError:
+            # A plain file named "requirements" lands here
+            pass
+
     return False
 
 
@@ -73,10 +105,5 @@ def has_setuptools_files(root: Path) -> bool:
     Returns:
         True if setuptools files found, False otherwise
     """
-    if (root / "setup.py").exists():
-        return True
-    
-    if (root / "setup.cfg").exists():
-        return True
-    
-    return False
+    names = _root_listing(root)
+    return "setup.py" in names or "setup.cfg" in names
@@ -5,12 +5,55 @@ Uses ONLY detected capabilities from Phase 7.
 No filesystem inspection, no heuristics, no guessing.
 """
 
+import os
 from pathlib import Path
-from typing import Tuple
+from typing import FrozenSet, Optional, Tuple
 
 from pyready.schemas.capability_schema import ProjectCapabilities
 from pyready.project_intent.models import ProjectIntent
 
+# Classification outcomes, shared across the rule table below
+_NO_PYTHON = (
+    ProjectIntent.UNKNOWN,
+    "No Python files detected"
+)
+_SCRIPT = (
+    ProjectIntent.SCRIPT,
+    "Python files found, no dependencies or entry point declared"
+)
+_LIBRARY = (
+    ProjectIntent.LIBRARY,
+    "Dependencies declared, no entry point detected (reusable package)"
+)
+_SERVICE = (
+    ProjectIntent.SERVICE,
+    "Entry point, dependencies, and environment configuration detected"
+)
+_APPLICATION = (
+    ProjectIntent.APPLICATION,
+    "Entry point and dependencies detected, no service configuration"
+)
+_UNMATCHED = (
+    ProjectIntent.UNKNOWN,
+    "Capability combination does not match known patterns"
+)
+
+# Every capability combination resolved up front, keyed by the bitmask
+# (has_python << 3) | (has_deps << 2) | (has_entry << 1) | has_env.
+# Without Python files nothing else matters; the env bit only separates
+# SERVICE from APPLICATION when both deps and entry point are present.
+_RULES = {key: _NO_PYTHON for key in range(0b1000)}
+_RULES.update({
+    0b1000: _SCRIPT,
+    0b1001: _SCRIPT,
+    0b1010: _UNMATCHED,
+    0b1011: _UNMATCHED,
+    0b1100: _LIBRARY,
+    0b1101: _LIBRARY,
+    0b1110: _APPLICATION,
+    0b1111: _SERVICE,
+})
+
 
 class ProjectIntentClassifier:
     """
@@ -39,71 +82,44 @@ class ProjectIntentClassifier:
             - intent: Classified ProjectIntent
             - reasoning: Human-readable explanation
         """
-        # Rule 1: Not a Python project
-        if not self.capabilities.has_python_files:
-            return (
-                ProjectIntent.UNKNOWN,
-                "No Python files detected"
-            )
-        
-        # Rule 2: Script (Python files, no deps, no entry point)
-        if (not self.capabilities.has_dependency_declaration and
-            not self.capabilities.has_detectable_entrypoint):
-            return (
-                ProjectIntent.SCRIPT,
-                "Python files found, no dependencies or entry point declared"
-            )
-        
-        # Rule 3: Library (deps declared, no entry point)
-        if (self.capabilities.has_dependency_declaration and
-            not self.capabilities.has_detectable_entrypoint):
-            return (
-                ProjectIntent.LIBRARY,
-                "Dependencies declared, no entry point detected (reusable package)"
-            )
-        
-        # Check for environment variable requirements (needed for SERVICE classification)
-        has_env_requirements = self._has_env_requirements()
-        
-        # Rule 4: Service (entry point + deps + env requirements)
-        if (self.capabilities.has_detectable_entrypoint and
-            self.capabilities.has_dependency_declaration and
-            has_env_requirements):
-            return (
-                ProjectIntent.SERVICE,
-                "Entry point, dependencies, and environment configuration detected"
-            )
-        
-        # Rule 5: Application (entry point + deps, no env requirements)
-        if (self.capabilities.has_detectable_entrypoint and
-            self.capabilities.has_dependency_declaration):
-            return (
-                ProjectIntent.APPLICATION,
-                "Entry point and dependencies detected, no service configuration"
-            )
-        
-        # Rule 6: Unknown (edge cases)
-        # Example: has entry point but no dependencies (unusual)
-        return (
-            ProjectIntent.UNKNOWN,
-            "Capability combination does not match known patterns"
+        capabilities = self.capabilities
+        key = (
+            (capabilities.has_python_files << 3)
+            | (capabilities.has_dependency_declaration << 2)
+            | (capabilities.has_detectable_entrypoint << 1)
         )
+
+        # The env check hits the filesystem; only pay for it on the one
+        # branch where it changes the outcome (SERVICE vs APPLICATION)
+        if key & 0b0110 == 0b0110:
+            key |= int(self._has_env_requirements())
+
+        return _RULES[key]
     
-    def _has_env_requirements(self) -> bool:
+    def _has_env_requirements(self, root_names: Optional[FrozenSet[str]] = None) -> bool:
         """
         Check if project declares environment variable requirements.
-        
+
         Evidence:
         - .env.example exists
         - .env.template exists
-        
+
+        Args:
+            root_names: Pre-fetched root directory listing; callers that
+                already hold one avoid a second directory read here
+
         Returns:
             True if env requirements are declared
         """
-        env_example = self.project_path / '.env.example'
-        env_template = self.project_path / '.env.template'
-        
-        return env_example.exists() or env_template.exists()
+        # One listdir answers both candidate checks instead of a stat
+        # syscall per filename
+        if root_names is None:
+            try:
+                root_names = frozenset(os.listdir(self.project_path))
+            except OSError:
+                return False
+
+        return '.env.example' in root_names or '.env.template' in root_names
 
 
 def classify_project_intent(capabilities: ProjectCapabilities, project_path: Path) -> Tuple[ProjectIntent, str]:
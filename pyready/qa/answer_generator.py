@@ -2,11 +2,120 @@
 
 from typing import Dict, Any, Optional
 import json
+import os
+
+# orjson serializes artifact dicts several times faster than stdlib
+# json; optional, like everywhere else in the CLI
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from pyready.llm.client import LLMClient, LLMError
 from pyready.llm.groq_client import GroqClient
 from .classifier import QuestionType
 
+# Prompt sections built once at import; _build_prompt only substitutes
+# the per-question slots instead of re-allocating ~1KB of static text
+_BASE_INSTRUCTIONS = """You are a technical assistant answering questions about a Python project.
+
+CRITICAL RULES:
+1. Use ONLY the provided artifacts below
+2. Do NOT speculate or infer missing information
+3. If artifacts don't contain enough information, say "Not enough information in the analysis"
+4. Cite specific artifact fields in your answer
+5. Format your answer as:
+
+   Answer:
+   <2-4 line factual explanation>
+
+   Evidence:
+   - <artifact>: <fact>
+   - <artifact>: <fact>
+
+6. Do NOT provide opinions or recommendations
+"""
+
+# Question-specific instructions
+_INSTRUCTIONS = {
+    QuestionType.WHY_REQUIRED: """
+Question type: "Why is X required?"
+
+Check if the package appears in:
+- dependencies (production)
+- dev_dependencies (development only)
+
+If found, explain its typical use case based on package name only.
+If not found, state it's not listed as a dependency.
+""",
+    QuestionType.WHAT_RUNS: """
+Question type: "What runs when I start the project?"
+
+Explain:
+1. The detected run command
+2. What the command does (based on command_type)
+3. The entry point (based on evidence)
+
+Use only the provided run_command, command_type, and evidence fields.
+""",
+    QuestionType.WHAT_BREAKS: """
+Question type: "What breaks if I remove X?"
+
+Check if package is in dependencies.
+If yes: State it's a direct dependency and may be used by the application.
+If no: State it's not a declared dependency.
+
+Do NOT scan code to find usage - only check dependency declarations.
+""",
+    QuestionType.WHERE_USED: """
+Question type: "Where is X used?"
+
+Check if package is in dependencies.
+If yes: State it's declared as a dependency.
+If no: State it's not found in dependencies.
+
+IMPORTANT: You do NOT have access to source code or import information.
+Only report what's in the dependency declarations.
+""",
+}
+
+
+# Shared tail with the two per-question slots
+_QA_FOOTER = """
+
+Question: {question}
+
+Available Artifacts:
+{artifacts_json}
+
+Generate your answer now:"""
+
+# Fully composed template per question type, assembled once at import:
+# building a prompt is then a single format call instead of stitching
+# the base, specific, and footer pieces back together per question
+_TEMPLATES = {
+    question_type: _BASE_INSTRUCTIONS + "\n\n" + specific + _QA_FOOTER
+    for question_type, specific in _INSTRUCTIONS.items()
+}
+
+_FALLBACK_TEMPLATE = _BASE_INSTRUCTIONS + "\n\nThis question type is not supported." + _QA_FOOTER
+
+
+def _dump_artifacts(artifacts: Dict[str, Any]) -> str:
+    """
+    Serialize artifacts for the prompt, compact by default.
+
+    Compact JSON is both faster to produce and cheaper to send — the
+    indent=2 whitespace only burned tokens. Set PYREADY_DEBUG_PROMPTS=1
+    to get the pretty-printed form back for inspection.
+    """
+    if os.getenv("PYREADY_DEBUG_PROMPTS") == "1":
+        return json.dumps(artifacts, indent=2)
+
+    if orjson is not None:
+        return orjson.dumps(artifacts, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(artifacts, separators=(',', ':'))
+
 
 class AnswerGenerator:
     """
@@ -74,87 +183,7 @@ class AnswerGenerator:
         MUST NOT pass file paths for reading or any source code.
         """
         # Convert artifacts to JSON for structured context
-        artifacts_json = json.dumps(artifacts, indent=2)
-        
-        base_instructions = """You are a technical assistant answering questions about a Python project.
-
-CRITICAL RULES:
-1. Use ONLY the provided artifacts below
-2. Do NOT speculate or infer missing information
-3. If artifacts don't contain enough information, say "Not enough information in the analysis"
-4. Cite specific artifact fields in your answer
-5. Format your answer as:
-   
-   Answer:
-   <2-4 line factual explanation>
-   
-   Evidence:
-   - <artifact>: <fact>
-   - <artifact>: <fact>
-
-6. Do NOT provide opinions or recommendations
-"""
-        
-        # Question-specific instructions
-        if question_type == QuestionType.WHY_REQUIRED:
-            specific_instructions = """
-Question type: "Why is X required?"
-
-Check if the package appears in:
-- dependencies (production)
-- dev_dependencies (development only)
-
-If found, explain its typical use case based on package name only.
-If not found, state it's not listed as a dependency.
-"""
-        
-        elif question_type == QuestionType.WHAT_RUNS:
-            specific_instructions = """
-Question type: "What runs when I start the project?"
-
-Explain:
-1. The detected run command
-2. What the command does (based on command_type)
-3. The entry point (based on evidence)
+        artifacts_json = _dump_artifacts(artifacts)
 
-Use only the provided run_command, command_type, and evidence fields.
-"""
-        
-        elif question_type == QuestionType.WHAT_BREAKS:
-            specific_instructions = """
-Question type: "What breaks if I remove X?"
-
-Check if package is in dependencies.
-If yes: State it's a direct dependency and may be used by the application.
-If no: State it's not a declared dependency.
-
-Do NOT scan code to find usage - only check dependency declarations.
-"""
-        
-        elif question_type == QuestionType.WHERE_USED:
-            specific_instructions = """
-Question type: "Where is X used?"
-
-Check if package is in dependencies.
-If yes: State it's declared as a dependency.
-If no: State it's not found in dependencies.
-
-IMPORTANT: You do NOT have access to source code or import information.
-Only report what's in the dependency declarations.
-"""
-        
-        else:
-            specific_instructions = "This question type is not supported."
-        
-        prompt = f"""{base_instructions}
-
-{specific_instructions}
-
-Question: {question}
-
-Available Artifacts:
-{artifacts_json}
-
-Generate your answer now:"""
-        
-        return prompt
+        template = _TEMPLATES.get(question_type, _FALLBACK_TEMPLATE)
+        return template.format(question=question, artifacts_json=artifacts_json)
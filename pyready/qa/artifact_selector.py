@@ -1,9 +1,10 @@
 """Artifact selection based on question type."""
 
-from typing import Dict, Any, Optional, List
+from functools import cached_property
+from typing import Dict, Any, FrozenSet, Optional, List
 from pathlib import Path
-import tomli
 
+from pyready.project_detection._cache import load_pyproject
 from .classifier import QuestionType
 
 
@@ -116,43 +117,49 @@ class ArtifactSelector:
         
         return artifacts
     
+    @cached_property
+    def _poetry_config(self) -> Dict[str, Any]:
+        """The [tool.poetry] table, parsed once via the shared cache."""
+        # Guard each level's shape: the baseline's try/except treated a
+        # pyproject.toml with scalar tool/poetry values as "no deps"
+        tool = load_pyproject(self.pyproject_path).get("tool")
+        poetry = tool.get("poetry") if isinstance(tool, dict) else None
+        return poetry if isinstance(poetry, dict) else {}
+
+    @cached_property
+    def _dependencies(self) -> Dict[str, str]:
+        deps = self._poetry_config.get("dependencies")
+        if not isinstance(deps, dict):
+            return {}
+        # Copy before popping: the cached parse is shared with other
+        # callers of load_pyproject
+        deps = dict(deps)
+        # Remove python itself
+        deps.pop("python", None)
+        return deps
+
+    @cached_property
+    def _dev_dependencies(self) -> Dict[str, str]:
+        group = self._poetry_config.get("group")
+        dev = group.get("dev") if isinstance(group, dict) else None
+        deps = dev.get("dependencies") if isinstance(dev, dict) else None
+        return dict(deps) if isinstance(deps, dict) else {}
+
+    @cached_property
+    def _direct_dependency_names(self) -> FrozenSet[str]:
+        # Lowercased for case-insensitive membership tests
+        return frozenset(k.lower() for k in self._dependencies) | frozenset(
+            k.lower() for k in self._dev_dependencies
+        )
+
     def _get_dependencies(self) -> Dict[str, str]:
         """Get production dependencies from pyproject.toml."""
-        if not self.pyproject_path.exists():
-            return {}
-        
-        try:
-            with open(self.pyproject_path, "rb") as f:
-                pyproject = tomli.load(f)
-            
-            deps = pyproject.get("tool", {}).get("poetry", {}).get("dependencies", {})
-            # Remove python itself
-            deps.pop("python", None)
-            return deps
-        except Exception:
-            return {}
-    
+        return self._dependencies
+
     def _get_dev_dependencies(self) -> Dict[str, str]:
         """Get dev dependencies from pyproject.toml."""
-        if not self.pyproject_path.exists():
-            return {}
-        
-        try:
-            with open(self.pyproject_path, "rb") as f:
-                pyproject = tomli.load(f)
-            
-            return pyproject.get("tool", {}).get("poetry", {}).get("group", {}).get("dev", {}).get("dependencies", {})
-        except Exception:
-            return {}
-    
+        return self._dev_dependencies
+
     def _is_direct_dependency(self, package_name: str) -> bool:
-        """Check if package is a direct dependency."""
-        deps = self._get_dependencies()
-        dev_deps = self._get_dev_dependencies()
-        
-        # Normalize package name (handle case sensitivity)
-        package_lower = package_name.lower()
-        
-        all_deps = {k.lower(): v for k, v in {**deps, **dev_deps}.items()}
-        
-        return package_lower in all_deps
+        """Check if package is a direct dependency (prod or dev)."""
+        return package_name.lower() in self._direct_dependency_names
@@ -1,9 +1,14 @@
 """Run command detection logic with deterministic, evidence-based approach."""
 
 import ast
+import sys
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-import tomli
+
+if sys.version_info >= (3, 11):
+    import tomllib as tomli
+else:
+    import tomli
 
 from .models import RunCommandResult, EvidenceItem, RunCommandType, DetectionBasis
 